@@ -0,0 +1,36 @@
+"""Streamlit-free helpers for sending articles to Ada's bulk articles endpoint."""
+
+MAX_UPLOAD_BATCH_BYTES = 5 * 1024 * 1024
+UPLOAD_ARTICLE_OVERHEAD_BYTES = 256
+
+def pack_upload_batches(articles, max_items, max_bytes=MAX_UPLOAD_BATCH_BYTES):
+    """Group articles into upload batches capped by both article count and approximate request size."""
+    # Packing largest first keeps big articles from splitting batches that small ones could have filled
+    batches = []
+    batch = []
+    batch_bytes = 0
+    for article in sorted(articles, key=lambda article: len(article['content']), reverse=True):
+        article_bytes = len(article['content']) + UPLOAD_ARTICLE_OVERHEAD_BYTES
+        if batch and (len(batch) >= max_items or batch_bytes + article_bytes > max_bytes):
+            batches.append(batch)
+            batch = []
+            batch_bytes = 0
+        batch.append(article)
+        batch_bytes += article_bytes
+    if batch:
+        batches.append(batch)
+    return batches
+
+def get_failed_article_ids(response_data, article_ids):
+    """Get the IDs of articles Ada reported as failed in a bulk response. Returns None if the response can't account for every article."""
+    # Ada answers with one {"id", "success", ...} result per article, optionally wrapped in a "data" envelope
+    results = response_data.get('data') if isinstance(response_data, dict) else response_data
+    if not isinstance(results, list):
+        return None
+    if not all(isinstance(result, dict) and 'id' in result and isinstance(result.get('success'), bool) for result in results):
+        return None
+    
+    succeeded = {result['id']: result['success'] for result in results}
+    if any(article_id not in succeeded for article_id in article_ids):
+        return None
+    return {article_id for article_id in article_ids if not succeeded[article_id]}
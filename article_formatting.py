@@ -0,0 +1,198 @@
+"""Streamlit-free helpers that turn Zendesk articles into Ada payloads."""
+import re
+import urllib.parse
+import html2text
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+MAX_ARTICLE_SIZE_BYTES = 100 * 1024
+
+# HTML to Markdown Conversion
+FAST_MARKDOWN_TAGS = {
+    '-text', '-comment', 'body', 'div', 'span', 'p', 'br', 'hr', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
+    'ul', 'ol', 'li', 'a', 'code', 'pre', 'strong', 'b', 'em', 'i', 'blockquote'
+}
+INLINE_MARKERS = {'strong': '**', 'b': '**', 'em': '_', 'i': '_', 'code': '`'}
+WHITESPACE_RE = re.compile(r'\s+')
+BLANK_LINE_RE = re.compile(r'\n[ \t]*(?=\n)')
+EXTRA_NEWLINES_RE = re.compile(r'\n{3,}')
+FENCED_CODE_RE = re.compile(r'^(`{3,})\n.*?\n\1$', re.MULTILINE | re.DOTALL)
+LINE_START_SYNTAX_RE = re.compile(r'^(\s*)(#+(?=\s|$)|[-+*](?=\s|$)|>|\d+(?=\.(?:\s|$)))')
+LIST_ITEM_RE = re.compile(r'^(\*|\d+\.) ')
+HTML2TEXT_OPTIONS = {'ignore_links': False, 'body_width': 0, 'unicode_snob': True}
+
+def html_to_markdown(html):
+    """Convert article HTML to Markdown, preferring the fast converter when it handles every tag on the page."""
+    if LexborHTMLParser is not None:
+        markdown = fast_html_to_markdown(html)
+        if markdown is not None:
+            return markdown
+    return create_converter().handle(html)
+
+def create_converter():
+    """Create an html2text converter with the shared options."""
+    # Converters keep parser state (e.g. open tables) between handle() calls, so each article gets a fresh one
+    converter = html2text.HTML2Text()
+    for option, value in HTML2TEXT_OPTIONS.items():
+        setattr(converter, option, value)
+    return converter
+
+def fast_html_to_markdown(html):
+    """Convert simple article HTML to Markdown with selectolax. Returns None if the page uses other tags."""
+    body = LexborHTMLParser(html).body
+    if body is None:
+        return ""
+    if any(node.tag not in FAST_MARKDOWN_TAGS for node in body.traverse(include_text=True)):
+        return None
+
+    markdown = tidy_markdown(render_markdown(body))
+    return f"{markdown}\n" if markdown else ""
+
+def tidy_markdown(markdown):
+    """Collapse the blank lines left between rendered blocks, leaving fenced code untouched."""
+    chunks = []
+    position = 0
+    for match in FENCED_CODE_RE.finditer(markdown):
+        chunks.append(EXTRA_NEWLINES_RE.sub('\n\n', BLANK_LINE_RE.sub('\n', markdown[position:match.start()])))
+        chunks.append(match.group())
+        position = match.end()
+    chunks.append(EXTRA_NEWLINES_RE.sub('\n\n', BLANK_LINE_RE.sub('\n', markdown[position:])))
+    return "".join(chunks).strip()
+
+def escape_line_start(text):
+    """Backslash-escape text that would otherwise start a heading, list or blockquote."""
+    return LINE_START_SYNTAX_RE.sub(lambda m: f"{m[1]}{m[2]}\\" if m[2][0].isdigit() else f"{m[1]}\\{m[2]}", text, count=1)
+
+def starts_line(parts, line_start):
+    """Check whether the next rendered part begins a new Markdown line."""
+    for part in reversed(parts):
+        part = part.rstrip(' ')
+        if part:
+            return part.endswith('\n')
+    return line_start
+
+def wrap_inline(inner, opening, closing):
+    """Wrap inline Markdown in markers, keeping whitespace from inside the tag outside the markers."""
+    text = inner.strip()
+    if not text:
+        return inner
+    leading = inner[:len(inner) - len(inner.lstrip())]
+    trailing = inner[len(inner.rstrip()):]
+    return f"{leading}{opening}{text}{closing}{trailing}"
+
+def render_markdown(node, line_start=True):
+    """Render the children of a parsed HTML node as Markdown."""
+    parts = []
+    previous_tag = None
+    for child in node.iter(include_text=True):
+        tag = child.tag
+        if tag == '-text':
+            text = WHITESPACE_RE.sub(' ', child.text(deep=False))
+            parts.append(escape_line_start(text) if starts_line(parts, line_start) else text)
+        elif tag in ('h1', 'h2', 'h3', 'h4', 'h5', 'h6'):
+            parts.append(f"\n\n{'#' * int(tag[1])} {render_markdown(child, False).strip()}\n\n")
+        elif tag in ('p', 'div'):
+            parts.append(f"\n\n{render_markdown(child).strip()}\n\n")
+        elif tag == 'br':
+            parts.append("  \n")
+        elif tag == 'hr':
+            parts.append("\n\n* * *\n\n")
+        elif tag in INLINE_MARKERS:
+            marker = INLINE_MARKERS[tag]
+            inline = wrap_inline(render_markdown(child, False), marker, marker)
+            # Back-to-back runs of the same style merge into one, since `_a__b_` isn't valid emphasis
+            if INLINE_MARKERS.get(previous_tag) == marker and parts[-1].endswith(marker) and inline.startswith(marker):
+                parts[-1] = parts[-1][:-len(marker)]
+                inline = inline[len(marker):]
+            parts.append(inline)
+        elif tag == 'a':
+            inner = render_markdown(child, False)
+            href = child.attributes.get('href')
+            parts.append(wrap_inline(inner, "[", f"]({href})") if href else inner)
+        elif tag == 'pre':
+            code = child.text(deep=True).strip('\n')
+            parts.append(f"\n\n```\n{code}\n```\n\n")
+        elif tag == 'blockquote':
+            lines = tidy_markdown(render_markdown(child)).splitlines()
+            parts.append("\n\n" + "\n".join(f"> {line}".rstrip() for line in lines) + "\n\n")
+        elif tag in ('ul', 'ol'):
+            items = []
+            for number, item in enumerate((li for li in child.iter() if li.tag == 'li'), 1):
+                marker = f"{number}." if tag == 'ol' else "*"
+                indent = " " * (len(marker) + 1)
+                lines = tidy_markdown(render_markdown(item)).splitlines() or [""]
+                # Blank lines keep an item's paragraphs apart, but nested lists stay tight against the line above
+                lines = [line for index, line in enumerate(lines) if line or not LIST_ITEM_RE.match(lines[index + 1])]
+                items.append("\n".join([f"{marker} {lines[0]}"] + [f"{indent}{line}" if line else "" for line in lines[1:]]))
+            parts.append("\n\n" + "\n".join(items) + "\n\n")
+        elif tag != '-comment':
+            parts.append(render_markdown(child, starts_line(parts, line_start)))
+        previous_tag = tag
+    return "".join(parts)
+
+# Article Formatting
+def check_article_size(content):
+    """Check if article content size is below 100KB."""
+    # UTF-8 uses 1-4 bytes per character, so only encode when the length alone can't decide
+    if len(content) > MAX_ARTICLE_SIZE_BYTES:
+        return False
+    if len(content) * 4 <= MAX_ARTICLE_SIZE_BYTES or content.isascii():
+        return True
+    return len(content.encode('utf-8')) <= MAX_ARTICLE_SIZE_BYTES
+
+def correct_article_url(article):
+    """Rewrite an article's URL onto its brand's domain, keeping the path, query and fragment."""
+    zd_html_url = article.get("html_url", "")
+    brand_base_url = article.get('_brand_url')
+    if not brand_base_url or not zd_html_url:
+        return zd_html_url
+
+    parts = urllib.parse.urlsplit(zd_html_url)
+    brand = urllib.parse.urlsplit(brand_base_url)
+    return urllib.parse.urlunsplit((brand.scheme or 'https', brand.netloc, parts.path, parts.query, parts.fragment))
+
+def format_articles(articles, knowledge_source_id, override_language=None, title_prefix=""):
+    """Format articles for Ada. Returns (formatted, skipped_titles, corrected_url_count)."""
+    formatted = []
+    skipped_titles = []
+    corrected_url_count = 0
+
+    for article in articles:
+        zd_id = article.get("id")
+        zd_title = article.get("title", "")
+        zd_body = article.get("body") or ""
+        zd_html_url = article.get("html_url", "")
+        zd_locale = article.get("locale", "en")
+
+        final_title = f"{title_prefix}{zd_title}"
+
+        # Use the user-specified language, or the language from the Zendesk article
+        if override_language and override_language.strip():
+            ada_language = override_language.strip().lower()
+        else:
+            ada_language = zd_locale.lower() if zd_locale else "en"
+
+        corrected_url = article.get('_corrected_url') or correct_article_url(article)
+        if corrected_url != zd_html_url:
+            corrected_url_count += 1
+
+        markdown_content = html_to_markdown(zd_body)
+
+        if not check_article_size(markdown_content):
+            skipped_titles.append(final_title)
+            continue
+
+        formatted.append({
+            "id": f"zd_{zd_id}-{zd_locale}",  # Include locale in ID
+            "name": final_title[:255],  # Apply prefix and truncate
+            "content": markdown_content,
+            "knowledge_source_id": knowledge_source_id,
+            "url": corrected_url,
+            "tag_ids": [],
+            "language": ada_language
+        })
+
+    return formatted, skipped_titles, corrected_url_count
@@ -0,0 +1,41 @@
+import pytest
+
+from ada_upload import UPLOAD_ARTICLE_OVERHEAD_BYTES, get_failed_article_ids, pack_upload_batches
+
+def make_article(article_id, size):
+    return {"id": article_id, "content": "x" * size}
+
+def test_batches_are_capped_by_article_count():
+    articles = [make_article(f"a{i}", 10) for i in range(5)]
+    batches = pack_upload_batches(articles, max_items=2)
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+
+def test_batches_are_capped_by_size_largest_first():
+    max_bytes = 1000 + 2 * UPLOAD_ARTICLE_OVERHEAD_BYTES
+    articles = [make_article("small", 100), make_article("big", 900), make_article("medium", 500)]
+    batches = pack_upload_batches(articles, max_items=10, max_bytes=max_bytes)
+    assert [[article["id"] for article in batch] for batch in batches] == [["big"], ["medium", "small"]]
+
+def test_oversized_article_gets_its_own_batch():
+    batches = pack_upload_batches([make_article("huge", 5000), make_article("tiny", 1)], max_items=10, max_bytes=1000)
+    assert [[article["id"] for article in batch] for batch in batches] == [["huge"], ["tiny"]]
+
+@pytest.mark.parametrize("response_data, expected", [
+    ([{"id": "a", "success": True}, {"id": "b", "success": False}], {"b"}),
+    ({"data": [{"id": "a", "success": True}, {"id": "b", "success": True}]}, set()),
+    ([{"id": "a", "success": False, "created": False}, {"id": "b", "success": False}], {"a", "b"}),
+])
+def test_failed_ids_come_from_per_article_results(response_data, expected):
+    assert get_failed_article_ids(response_data, ["a", "b"]) == expected
+
+@pytest.mark.parametrize("response_data", [
+    None,
+    {"status": "ok"},
+    {"results": [{"id": "a", "success": True}, {"id": "b", "success": True}]},
+    [{"id": "a", "success": True}],
+    [{"id": "a", "success": True}, {"success": True}],
+    [{"id": "a", "success": True}, {"id": "b", "success": "false"}],
+    [{"id": "a", "success": True}, {"id": "b", "error": "bad"}],
+])
+def test_unrecognized_responses_return_none(response_data):
+    assert get_failed_article_ids(response_data, ["a", "b"]) is None
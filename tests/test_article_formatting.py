@@ -0,0 +1,41 @@
+import pytest
+
+from article_formatting import LexborHTMLParser, html_to_markdown
+
+pytestmark = pytest.mark.skipif(LexborHTMLParser is None, reason="selectolax is not installed")
+
+
+@pytest.mark.parametrize("html, expected", [
+    ("<p><strong>Save </strong>to</p>", "**Save** to\n"),
+    ("<p>the<em> new</em> flow</p>", "the _new_ flow\n"),
+    ("<p>run<code> make </code>now</p>", "run `make` now\n"),
+    ('<p>go<a href="/help"> here </a>now</p>', "go [here](/help) now\n"),
+    ("<p>a<b> </b>b</p>", "a b\n"),
+])
+def test_inline_whitespace_stays_outside_markers(html, expected):
+    assert html_to_markdown(html) == expected
+
+@pytest.mark.parametrize("html, expected", [
+    ("<h2>Title</h2><p>Body</p>", "## Title\n\nBody\n"),
+    ("<ul><li>a<ul><li>b</li></ul></li><li>c</li></ul>", "* a\n  * b\n* c\n"),
+    ("<ol><li><p>one</p><p>two</p></li><li>three</li></ol>", "1. one\n\n   two\n2. three\n"),
+    ("<blockquote><p>a</p><p>b</p></blockquote>", "> a\n>\n> b\n"),
+    ("<p>x</p><pre>a\n\n\n  \nb</pre><p>y</p>", "x\n\n```\na\n\n\n  \nb\n```\n\ny\n"),
+    ("<em>a</em><em>b</em>", "_ab_\n"),
+])
+def test_block_structure(html, expected):
+    assert html_to_markdown(html) == expected
+
+@pytest.mark.parametrize("html, expected", [
+    ("<p>1. not a list</p>", "1\\. not a list\n"),
+    ("<p>- x</p>", "\\- x\n"),
+    ("<p>+ x</p>", "\\+ x\n"),
+    ("<p># x</p>", "\\# x\n"),
+    ("<p>&gt; x</p>", "\\> x\n"),
+    ("<p>a<br>- b</p>", "a  \n\\- b\n"),
+    ("<ul><li>- x</li></ul>", "* \\- x\n"),
+    ("<p>Step 2. done - or not</p>", "Step 2. done - or not\n"),
+    ("<p><code>- x</code></p>", "`- x`\n"),
+])
+def test_line_start_syntax_is_escaped(html, expected):
+    assert html_to_markdown(html) == expected
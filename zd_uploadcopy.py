@@ -1,7 +1,8 @@
 import streamlit as st
 import requests
 from requests.auth import HTTPBasicAuth
-import html2text
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
 import json
 import re
@@ -9,37 +10,81 @@ import random
 import string
 import datetime
 import pandas as pd
-import urllib.parse
+import numpy as np
+import threading
+import http.cookiejar
+import collections
+import logging
+from logging.handlers import RotatingFileHandler
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+from article_formatting import format_articles, correct_article_url
+from ada_upload import pack_upload_batches, get_failed_article_ids
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Constants
 RATE_LIMIT_DELAY = 0.1
+RATE_LIMIT_LOW_WATERMARK = 10
+RATE_LIMIT_WINDOW = 60
+UPLOAD_WORKERS = 8
+UPLOAD_BATCH_SIZE = 50
+MAX_UPLOAD_BATCH_SIZE = 100
+SPLITTABLE_UPLOAD_STATUSES = {413, 422}
+FETCH_WORKERS = 10
+BACKGROUND_WORKERS = 4
+BACKGROUND_POLL_INTERVAL = 1
+ARTICLE_FIELDS = ('id', 'title', 'body', 'locale', 'section_id', 'draft', 'html_url', 'updated_at', 'brand_id')
+METADATA_CACHE_TTL = 3600
 DEFAULT_LANGUAGE = "en"
+CONNECT_TIMEOUT = 10
+REQUEST_TIMEOUT = (CONNECT_TIMEOUT, 30)
+UPLOAD_TIMEOUT = (CONNECT_TIMEOUT, 60)
+LOG_PAYLOAD_LIMIT = 500
+LOG_PAYLOAD_ENCODER = json.JSONEncoder(separators=(',', ':'), default=str)
+DEFAULT_LOG_ENTRIES = 2000
+LOG_CAP_SETTING = os.environ.get('ZD_ADA_LOG_CAP', '')
+LOG_FILE_PATH = os.environ.get('ZD_ADA_LOG_FILE', '')
+LOG_FILE_MAX_BYTES = 10 * 1024 * 1024
+LOG_FILE_BACKUPS = 5
+STATUS_STYLES = {
+    "SUCCESS": "background-color: #d4edda; color: #155724",
+    "ERROR": "background-color: #f8d7da; color: #721c24",
+    "WARNING": "background-color: #fff3cd; color: #856404"
+}
+DEFAULT_STATUS_STYLE = "background-color: #d1ecf1; color: #0c5460"
+SUBDOMAIN_RE = re.compile(r'[A-Za-z0-9-]+')
+ID_ALPHABET = string.ascii_letters + string.digits
+ID_RANDOM = random.SystemRandom()
 
 # Logging System
+def get_log_cap():
+    """Get how many log entries to keep in the app: ZD_ADA_LOG_CAP when it is a valid number, at least 1."""
+    try:
+        return max(int(LOG_CAP_SETTING), 1)
+    except ValueError:
+        return DEFAULT_LOG_ENTRIES
+
 def init_logs():
     """Initialize logs in session state."""
+    # Background fetch and upload threads append while the page renders, so reads and writes share this lock
+    if 'api_logs_lock' not in st.session_state:
+        st.session_state['api_logs_lock'] = threading.Lock()
     if 'api_logs' not in st.session_state:
-        st.session_state['api_logs'] = []
+        st.session_state['api_logs'] = collections.deque(maxlen=get_log_cap())
 
 def add_log(action, status, endpoint="", request_payload=None, response_payload=None, details=""):
     """Add a detailed log entry."""
-    if 'api_logs' not in st.session_state:
-        st.session_state['api_logs'] = []
-    
-    request_str = ""
-    response_str = ""
+    init_logs()
     
-    if request_payload:
-        try:
-            request_str = json.dumps(request_payload, indent=2)[:500] + ("..." if len(json.dumps(request_payload)) > 500 else "")
-        except:
-            request_str = str(request_payload)[:500]
-    
-    if response_payload:
-        try:
-            response_str = json.dumps(response_payload, indent=2)[:500] + ("..." if len(json.dumps(response_payload)) > 500 else "")
-        except:
-            response_str = str(response_payload)[:500]
+    # Payloads are the expensive part of a log entry, so only serialize them when they are being recorded
+    record_payloads = st.session_state.get('debug_logs', True)
+    request_str = summarize_payload(request_payload) if request_payload and record_payloads else ""
+    response_str = summarize_payload(response_payload) if response_payload and record_payloads else ""
     
     log_entry = {
         "timestamp": datetime.datetime.now().strftime("%H:%M:%S"),
@@ -50,32 +95,251 @@ def add_log(action, status, endpoint="", request_payload=None, response_payload=
         "response": response_str,
         "details": details
     }
-    st.session_state['api_logs'].append(log_entry)
+    with st.session_state['api_logs_lock']:
+        st.session_state['api_logs'].append(log_entry)
+    if DISK_LOGGER is not None:
+        DISK_LOGGER.info(encode_json(log_entry).decode("utf-8"))
+
+def summarize_payload(payload):
+    """Serialize a log payload compactly, stopping as soon as it passes the display limit."""
+    try:
+        chunks = []
+        size = 0
+        for chunk in LOG_PAYLOAD_ENCODER.iterencode(payload):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size > LOG_PAYLOAD_LIMIT:
+                return "".join(chunks)[:LOG_PAYLOAD_LIMIT] + "..."
+        return "".join(chunks)
+    except (TypeError, ValueError):
+        return str(payload)[:LOG_PAYLOAD_LIMIT]
 
 def clear_logs():
     """Clear all logs."""
-    st.session_state['api_logs'] = []
+    init_logs()
+    with st.session_state['api_logs_lock']:
+        st.session_state['api_logs'] = collections.deque(maxlen=get_log_cap())
+
+def get_log_snapshot():
+    """Copy the current log entries, oldest first, without racing threads that are adding logs."""
+    init_logs()
+    with st.session_state['api_logs_lock']:
+        return list(st.session_state['api_logs'])
+
+def style_status_column(statuses):
+    """Map a column of log statuses to their cell styles in one vectorized pass."""
+    return statuses.map(STATUS_STYLES).fillna(DEFAULT_STATUS_STYLE)
+
+def get_logs_view(logs, log_filter, show_payloads):
+    """Get the styled logs table for the current logs and display options."""
+    # Every append replaces the newest entry, so its identity tells us whether the logs changed
+    snapshot = get_log_snapshot()
+    newest = snapshot[-1]
+    
+    def build():
+        if show_payloads:
+            display_columns = ['timestamp', 'action', 'status', 'endpoint', 'request', 'response', 'details']
+        else:
+            display_columns = ['timestamp', 'action', 'status', 'endpoint', 'details']
+        
+        # Read the snapshot newest-first so the table never needs a reversed copy, keep only the
+        # matching rows, and only pull the displayed fields so hidden payload strings never become columns
+        rows = reversed(snapshot)
+        if log_filter != "All":
+            rows = (log for log in rows if log['status'] == log_filter)
+        logs_df = pd.DataFrame(list(rows), columns=display_columns)
+        return logs_df.style.apply(style_status_column, subset=['status'])
+    
+    return get_cached_value('logs_view', (logs, newest), (log_filter, show_payloads), build)
+
+def get_disk_logger():
+    """Get the rotating JSON-lines log file writer, or None when ZD_ADA_LOG_FILE is not set."""
+    if not LOG_FILE_PATH:
+        return None
+    logger = logging.getLogger("zd_ada_sync")
+    if not logger.handlers:
+        handler = RotatingFileHandler(LOG_FILE_PATH, maxBytes=LOG_FILE_MAX_BYTES, backupCount=LOG_FILE_BACKUPS, encoding='utf-8')
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+    return logger
+
+DISK_LOGGER = get_disk_logger()
+
+# HTTP Session
+@st.cache_resource(show_spinner=False)
+def get_http_session():
+    """Get the pooled HTTP session shared by all Zendesk and Ada calls across reruns and users."""
+    session = requests.Session()
+    # Credentials are sent per request; never let one user's cookies ride along on another's calls
+    session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+    # POST stays out of automatic retries: re-sending a knowledge source creation could duplicate it,
+    # and bulk uploads handle 429 themselves
+    retries = Retry(
+        total=8,
+        backoff_factor=0.5,
+        backoff_jitter=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=50, max_retries=retries)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+def parse_json(response):
+    """Parse a JSON response body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+def encode_json(data):
+    """Serialize data as compact JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+def dump_json(data):
+    """Serialize data as indented JSON bytes for downloads, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+def get_download_bytes(name, source, build=None):
+    """Get the JSON bytes for a download."""
+    downloads = st.session_state.setdefault('download_cache', {})
+    return get_cached_value(name, (source,), (), lambda: dump_json(build() if build else source), downloads)
+
+def show_message(job, kind, message):
+    """Show a status message, or queue it for the page while the named background job is running."""
+    notices = st.session_state.get(f'{job}_notices')
+    if notices is not None:
+        notices.append((kind, message))
+    else:
+        getattr(st, kind)(message)
+
+# Concurrency Helpers
+class RateLimiter:
+    """Space out requests globally, no matter how many threads send them, and back off when the server asks."""
+
+    def __init__(self, min_interval, low_watermark=RATE_LIMIT_LOW_WATERMARK):
+        self.min_interval = min_interval
+        self.low_watermark = low_watermark
+        self.next_slot = 0.0
+        self.throttle_interval = 0.0
+        self.throttle_until = 0.0
+        self.lock = threading.Lock()
+
+    def wait(self):
+        """Block until the next request slot is available."""
+        with self.lock:
+            now = time.monotonic()
+            interval = self.min_interval
+            if now < self.throttle_until:
+                interval = max(interval, self.throttle_interval)
+            delay = self.next_slot - now
+            self.next_slot = max(now, self.next_slot) + interval
+        if delay > 0:
+            time.sleep(delay)
+
+    def pause(self, seconds):
+        """Hold every thread's next request for at least `seconds`."""
+        with self.lock:
+            self.next_slot = max(self.next_slot, time.monotonic() + seconds)
+
+    def observe(self, headers):
+        """Slow down when rate-limit headers show the current window is nearly used up."""
+        try:
+            remaining = int(headers.get('X-Rate-Limit-Remaining') or headers.get('ratelimit-remaining'))
+        except (TypeError, ValueError):
+            return
+        if remaining >= self.low_watermark:
+            return
+        try:
+            reset = float(headers.get('ratelimit-reset') or RATE_LIMIT_WINDOW)
+        except ValueError:
+            reset = RATE_LIMIT_WINDOW
+        if remaining <= 0:
+            self.pause(reset)
+            return
+        # Space every thread's requests evenly over the rest of the window, not just the next one
+        with self.lock:
+            self.throttle_interval = reset / remaining
+            self.throttle_until = time.monotonic() + reset
+
+ZENDESK_LIMITER = RateLimiter(0)
+
+def create_executor(max_workers):
+    """Create a thread pool whose workers can log and write to the Streamlit page."""
+    ctx = get_script_run_ctx()
+    return ThreadPoolExecutor(max_workers=max_workers, initializer=add_script_run_ctx, initargs=(None, ctx))
+
+@st.cache_resource(show_spinner=False)
+def get_background_executor():
+    """Get the process-wide thread pool that runs long jobs outside the script run."""
+    return ThreadPoolExecutor(max_workers=BACKGROUND_WORKERS, thread_name_prefix="zd-ada-background")
+
+def run_in_background(fn, *args, **kwargs):
+    """Run fn on the background executor with this session's Streamlit context attached. Returns its future."""
+    ctx = get_script_run_ctx()
+    
+    def run():
+        add_script_run_ctx(threading.current_thread(), ctx)
+        return fn(*args, **kwargs)
+    
+    return get_background_executor().submit(run)
+
+def start_background_job(job, fn, *args, **kwargs):
+    """Start fn as the named background job, queueing its page messages until the result is shown."""
+    st.session_state[f'{job}_notices'] = []
+    st.session_state[f'{job}_submitted_at'] = time.monotonic()
+    st.session_state[f'{job}_future'] = run_in_background(fn, *args, **kwargs)
+
+def finish_background_job(job):
+    """Replay a finished job's queued messages and return its future, or None while it is still running."""
+    future = st.session_state.get(f'{job}_future')
+    if future is None or not future.done():
+        return None
+    del st.session_state[f'{job}_future']
+    for kind, message in st.session_state.pop(f'{job}_notices', []):
+        getattr(st, kind)(message)
+    return future
+
+@st.fragment(run_every=BACKGROUND_POLL_INTERVAL)
+def show_background_status(job, label):
+    """Show progress while a background job runs, then rerun the app to display its results."""
+    future = st.session_state.get(f'{job}_future')
+    if future is None or future.done():
+        st.rerun()
+    elapsed = time.monotonic() - st.session_state.get(f'{job}_submitted_at', time.monotonic())
+    with st.status(label, expanded=True):
+        st.write(f"⏱️ Running for {elapsed:.0f}s. You can keep adjusting settings while this runs.")
+
+def get_retry_after(response, default=60):
+    """Get the number of seconds to wait from a rate-limited response."""
+    try:
+        return max(0, int(float(response.headers.get('Retry-After', default))))
+    except (TypeError, ValueError):
+        return default
 
 # Utility Functions
 def is_valid_subdomain(subdomain):
     """Check if the provided subdomain is valid."""
-    regex = re.compile(r'^[a-zA-Z0-9-]+$')
-    return re.match(regex, subdomain) is not None
-
-def check_article_size(content):
-    """Check if article content size is below 100KB."""
-    max_size_kb = 100
-    content_size_kb = len(content.encode('utf-8')) / 1024
-    return content_size_kb <= max_size_kb
+    return SUBDOMAIN_RE.fullmatch(subdomain) is not None
 
-def get_zd_auth():
-    """Get Zendesk authentication tuple."""
-    zd_email = st.session_state.get('zd_email', '')
-    zd_token = st.session_state.get('zd_token', '')
+def build_zd_auth(zd_email, zd_token):
+    """Build Zendesk authentication from an email and API token."""
     if not zd_email or not zd_token:
         return None
     return HTTPBasicAuth(f"{zd_email}/token", zd_token)
 
+def get_zd_auth():
+    """Get Zendesk authentication tuple."""
+    return build_zd_auth(st.session_state.get('zd_email', ''), st.session_state.get('zd_token', ''))
+
 def has_zd_credentials():
     """Check if Zendesk credentials are provided."""
     zd_email = st.session_state.get('zd_email', '')
@@ -89,25 +353,64 @@ def get_brand_base_url(brand):
     else:
         return f"https://{brand['subdomain']}.zendesk.com"
 
+def slim_article(article):
+    """Keep only the article fields the app uses, dropping author, vote and permission data."""
+    return {field: article[field] for field in ARTICLE_FIELDS if field in article}
+
+def build_option_labels(items):
+    """Map each item's ID to its name, adding the ID to any name that several items share."""
+    name_counts = collections.Counter(item['name'] for item in items)
+    return {item['id']: item['name'] if name_counts[item['name']] == 1 else f"{item['name']} ({item['id']})" for item in items}
+
+def get_sync_scope(zd_subdomain, category_ids):
+    """Get the key an incremental sync watermark is stored under: the subdomain plus the selected categories."""
+    return (zd_subdomain, tuple(sorted(category_ids)))
+
 def filter_published_articles(articles):
-    """Filter articles to only include published ones."""
+    """Iterate over only the published articles when the published-only filter is enabled."""
     published_only = st.session_state.get('published_only', False)
     if not published_only:
-        return articles
-    
-    published_articles = []
-    for article in articles:
-        # An article is published if draft is False
-        if not article.get('draft', True):
-            published_articles.append(article)
-    
-    return published_articles
+        return iter(articles)
+    
+    # An article is published if draft is False
+    return (article for article in articles if not article.get('draft', True))
+
+def get_cached_value(name, sources, settings, build, store=None):
+    """Get a value cached in the session, rebuilding it only when its sources or settings change. Returns None if stale and build is None."""
+    # Sources are large objects compared by identity so they are never walked; settings are small and compared by value
+    store = st.session_state if store is None else store
+    cached = store.get(name)
+    if cached is None or any(old is not new for old, new in zip(cached[0], sources)) or cached[1] != settings:
+        if build is None:
+            return None
+        cached = (sources, settings, build())
+        store[name] = cached
+    return cached[2]
 
 # API Functions
-def get_locales():
+class UncachedResult(Exception):
+    """Raised from a cached getter to return a fallback value without caching it."""
+
+    def __init__(self, value):
+        super().__init__()
+        self.value = value
+
+def uncached_on_failure(getter):
+    """Wrap a cached getter so failed lookups return their fallback but are retried on the next call."""
+    # st.cache_data never caches a call that raises, so errors and timeouts don't stick for the whole TTL
+    def wrapper(*args, **kwargs):
+        try:
+            return getter(*args, **kwargs)
+        except UncachedResult as e:
+            return e.value
+    wrapper.__doc__ = getter.__doc__
+    wrapper.clear = getter.clear
+    return wrapper
+
+@uncached_on_failure
+@st.cache_data(ttl=METADATA_CACHE_TTL, show_spinner=False)
+def get_locales(zd_subdomain, zd_email, zd_token):
     """Fetch available locales from Zendesk."""
-    zd_subdomain = st.session_state.get('zd_subdomain', '')
-    
     if not zd_subdomain:
         st.error("❌ Zendesk subdomain is required")
         return [DEFAULT_LANGUAGE]
@@ -116,13 +419,13 @@ def get_locales():
     endpoint = f"https://{zd_subdomain}.zendesk.com/api/v2/locales"
     add_log("Fetch Locales", "INFO", endpoint, details="Requesting locales from Zendesk")
     
-    auth = get_zd_auth()  # This might be None if no credentials
+    auth = build_zd_auth(zd_email, zd_token)  # This might be None if no credentials
     
     try:
-        response = requests.get(endpoint, auth=auth, timeout=30)
+        response = get_http_session().get(endpoint, auth=auth, timeout=REQUEST_TIMEOUT)
         
         if response.status_code == 200:
-            response_data = response.json()
+            response_data = parse_json(response)
             locales = [locale['locale'].lower() for locale in response_data.get('locales', [])]
             result = locales if locales else [DEFAULT_LANGUAGE]
             add_log("Fetch Locales", "SUCCESS", endpoint, None, response_data, f"Found {len(result)} locales")
@@ -131,32 +434,32 @@ def get_locales():
             if auth is None:
                 # If no auth provided, return default
                 add_log("Fetch Locales", "INFO", endpoint, None, {"status": 401, "note": "No auth provided, using default"})
-                return [DEFAULT_LANGUAGE]
+                raise UncachedResult([DEFAULT_LANGUAGE])
             else:
                 error_msg = "❌ Authentication failed. Please check your Zendesk email and API token."
                 st.error(error_msg)
                 add_log("Fetch Locales", "ERROR", endpoint, None, {"status": 401, "error": error_msg})
-                return [DEFAULT_LANGUAGE]
+                raise UncachedResult([DEFAULT_LANGUAGE])
         else:
             error_response = {"status_code": response.status_code, "error": response.text}
             add_log("Fetch Locales", "ERROR", endpoint, None, error_response, f"Status: {response.status_code}")
             st.error(f"❌ Failed to fetch locales (Status {response.status_code}): {response.text}")
-            return [DEFAULT_LANGUAGE]
+            raise UncachedResult([DEFAULT_LANGUAGE])
             
     except requests.exceptions.RequestException as e:
         error_msg = f"❌ Network error: {str(e)}"
         st.error(error_msg)
         add_log("Fetch Locales", "ERROR", endpoint, None, {"error": error_msg})
-        return [DEFAULT_LANGUAGE]
+        raise UncachedResult([DEFAULT_LANGUAGE])
 
-def get_categories():
+@uncached_on_failure
+@st.cache_data(ttl=METADATA_CACHE_TTL, show_spinner=False)
+def get_categories(zd_subdomain, zd_email, zd_token):
     """Fetch available categories from Zendesk Help Center (requires authentication)."""
-    if not has_zd_credentials():
+    if not (zd_email and zd_token):
         add_log("Fetch Categories", "INFO", details="No credentials provided - skipping categories")
         return []
     
-    zd_subdomain = st.session_state.get('zd_subdomain', '')
-    
     if not zd_subdomain:
         st.warning("⚠️ Zendesk subdomain is required for categories")
         return []
@@ -164,13 +467,13 @@ def get_categories():
     endpoint = f"https://{zd_subdomain}.zendesk.com/api/v2/help_center/categories"
     add_log("Fetch Categories", "INFO", endpoint, details="Requesting categories from Zendesk Help Center")
     
-    auth = get_zd_auth()
+    auth = build_zd_auth(zd_email, zd_token)
     
     try:
-        response = requests.get(endpoint, auth=auth, timeout=30)
+        response = get_http_session().get(endpoint, auth=auth, timeout=REQUEST_TIMEOUT)
         
         if response.status_code == 200:
-            response_data = response.json()
+            response_data = parse_json(response)
             categories = response_data.get('categories', [])
             add_log("Fetch Categories", "SUCCESS", endpoint, None, response_data, f"Found {len(categories)} categories")
             if categories:
@@ -182,37 +485,37 @@ def get_categories():
             error_msg = "❌ Authentication failed. Please check your Zendesk email and API token."
             st.error(error_msg)
             add_log("Fetch Categories", "ERROR", endpoint, None, {"status": 401, "error": error_msg})
-            return []
+            raise UncachedResult([])
         elif response.status_code == 404:
             warning_msg = "⚠️ Help Center categories not found. This may mean:\n• Help Center is not enabled for your Zendesk instance\n• No categories have been created yet\n• Your plan doesn't include Help Center"
             st.warning(warning_msg)
             add_log("Fetch Categories", "WARNING", endpoint, None, {"status": 404, "error": "Help Center not found"}, "Help Center categories not available")
-            return []
+            raise UncachedResult([])
         elif response.status_code == 403:
             warning_msg = "⚠️ Access to Help Center categories is forbidden. Your account may not have the required permissions."
             st.warning(warning_msg)
             add_log("Fetch Categories", "WARNING", endpoint, None, {"status": 403, "error": "Access forbidden"}, "No permission for Help Center categories")
-            return []
+            raise UncachedResult([])
         else:
             error_response = {"status_code": response.status_code, "error": response.text[:200]}
             add_log("Fetch Categories", "ERROR", endpoint, None, error_response, f"Status: {response.status_code}")
             st.warning(f"⚠️ Could not fetch Help Center categories (Status {response.status_code}). Category filtering will not be available.")
-            return []
+            raise UncachedResult([])
             
     except requests.exceptions.RequestException as e:
         error_msg = f"❌ Network error: {str(e)}"
         st.warning(f"⚠️ Could not connect to Help Center categories endpoint: {str(e)}")
         add_log("Fetch Categories", "ERROR", endpoint, None, {"error": error_msg})
-        return []
+        raise UncachedResult([])
 
-def get_brands():
+@uncached_on_failure
+@st.cache_data(ttl=METADATA_CACHE_TTL, show_spinner=False)
+def get_brands(zd_subdomain, zd_email, zd_token):
     """Fetch available brands from Zendesk (requires authentication)."""
-    if not has_zd_credentials():
+    if not (zd_email and zd_token):
         add_log("Fetch Brands", "INFO", details="No credentials provided - skipping brands")
         return []
     
-    zd_subdomain = st.session_state.get('zd_subdomain', '')
-    
     if not zd_subdomain:
         st.error("❌ Zendesk subdomain is required")
         return []
@@ -220,13 +523,13 @@ def get_brands():
     endpoint = f"https://{zd_subdomain}.zendesk.com/api/v2/brands"
     add_log("Fetch Brands", "INFO", endpoint, details=f"Requesting brands from Zendesk")
     
-    auth = get_zd_auth()
+    auth = build_zd_auth(zd_email, zd_token)
     
     try:
-        response = requests.get(endpoint, auth=auth, timeout=30)
+        response = get_http_session().get(endpoint, auth=auth, timeout=REQUEST_TIMEOUT)
         
         if response.status_code == 200:
-            response_data = response.json()
+            response_data = parse_json(response)
             brands = response_data.get('brands', [])
             add_log("Fetch Brands", "SUCCESS", endpoint, None, response_data, f"Found {len(brands)} brands")
             st.success(f"✅ Successfully fetched {len(brands)} brands")
@@ -239,32 +542,32 @@ def get_brands():
             st.error("2. Verify your API token is active and correct")
             st.error("3. Check if your account has permission to access brands")
             add_log("Fetch Brands", "ERROR", endpoint, None, {"status": 401, "error": error_msg})
-            return []
+            raise UncachedResult([])
         elif response.status_code == 403:
             error_msg = "❌ Access forbidden. Your account may not have permission to access brands."
             st.error(error_msg)
             add_log("Fetch Brands", "ERROR", endpoint, None, {"status": 403, "error": error_msg})
-            return []
+            raise UncachedResult([])
         else:
             error_response = {"status_code": response.status_code, "error": response.text}
             add_log("Fetch Brands", "ERROR", endpoint, None, error_response, f"Status: {response.status_code}")
             st.error(f"❌ Failed to fetch brands (Status {response.status_code}): {response.text}")
-            return []
+            raise UncachedResult([])
             
     except requests.exceptions.RequestException as e:
         error_msg = f"❌ Network error: {str(e)}"
         st.error(error_msg)
         add_log("Fetch Brands", "ERROR", endpoint, None, {"error": error_msg})
-        return []
+        raise UncachedResult([])
 
-def get_sections():
+@uncached_on_failure
+@st.cache_data(ttl=METADATA_CACHE_TTL, show_spinner=False)
+def get_sections(zd_subdomain, zd_email, zd_token):
     """Fetch available sections from Zendesk Help Center (requires authentication)."""
-    if not has_zd_credentials():
+    if not (zd_email and zd_token):
         add_log("Fetch Sections", "INFO", details="No credentials provided - skipping sections")
         return []
     
-    zd_subdomain = st.session_state.get('zd_subdomain', '')
-    
     if not zd_subdomain:
         st.warning("⚠️ Zendesk subdomain is required for sections")
         return []
@@ -272,13 +575,13 @@ def get_sections():
     endpoint = f"https://{zd_subdomain}.zendesk.com/api/v2/help_center/sections"
     add_log("Fetch Sections", "INFO", endpoint, details="Requesting sections from Zendesk Help Center")
     
-    auth = get_zd_auth()
+    auth = build_zd_auth(zd_email, zd_token)
     
     try:
-        response = requests.get(endpoint, auth=auth, timeout=30)
+        response = get_http_session().get(endpoint, auth=auth, timeout=REQUEST_TIMEOUT)
         
         if response.status_code == 200:
-            response_data = response.json()
+            response_data = parse_json(response)
             sections = response_data.get('sections', [])
             add_log("Fetch Sections", "SUCCESS", endpoint, None, response_data, f"Found {len(sections)} sections")
             if sections:
@@ -290,29 +593,28 @@ def get_sections():
             error_msg = "❌ Authentication failed. Please check your Zendesk email and API token."
             st.error(error_msg)
             add_log("Fetch Sections", "ERROR", endpoint, None, {"status": 401, "error": error_msg})
-            return []
+            raise UncachedResult([])
         elif response.status_code == 404:
             warning_msg = "⚠️ Help Center sections not found. Help Center may not be enabled."
             st.warning(warning_msg)
             add_log("Fetch Sections", "WARNING", endpoint, None, {"status": 404, "error": "Help Center not found"}, "Help Center sections not available")
-            return []
+            raise UncachedResult([])
         else:
             error_response = {"status_code": response.status_code, "error": response.text[:200]}
             add_log("Fetch Sections", "WARNING", endpoint, None, error_response, f"Status: {response.status_code}")
             st.warning(f"⚠️ Could not fetch Help Center sections (Status {response.status_code}). Section-based filtering may not work.")
-            return []
+            raise UncachedResult([])
             
     except requests.exceptions.RequestException as e:
         error_msg = f"❌ Network error: {str(e)}"
         st.warning(f"⚠️ Could not connect to Help Center sections endpoint: {str(e)}")
         add_log("Fetch Sections", "ERROR", endpoint, None, {"error": error_msg})
-        return []
+        raise UncachedResult([])
 
-def get_existing_knowledge_sources():
+@uncached_on_failure
+@st.cache_data(ttl=METADATA_CACHE_TTL, show_spinner=False)
+def get_existing_knowledge_sources(ada_subdomain, ada_api_token):
     """Fetch existing knowledge sources from Ada."""
-    ada_subdomain = st.session_state.get('ada_subdomain', '')
-    ada_api_token = st.session_state.get('ada_api_token', '')
-    
     if not ada_subdomain or not ada_api_token:
         st.error("❌ Ada subdomain and API token are required")
         return []
@@ -326,10 +628,10 @@ def get_existing_knowledge_sources():
     }
     
     try:
-        response = requests.get(endpoint, headers=headers, timeout=30)
+        response = get_http_session().get(endpoint, headers=headers, timeout=REQUEST_TIMEOUT)
         
         if response.status_code == 200:
-            response_data = response.json()
+            response_data = parse_json(response)
             sources = response_data.get('data', [])
             add_log("Fetch Knowledge Sources", "SUCCESS", endpoint, None, response_data, f"Found {len(sources)} knowledge sources")
             return sources
@@ -337,23 +639,22 @@ def get_existing_knowledge_sources():
             error_msg = "❌ Authentication failed. Please check your Ada API token."
             st.error(error_msg)
             add_log("Fetch Knowledge Sources", "ERROR", endpoint, None, {"status": 401, "error": error_msg})
-            return []
+            raise UncachedResult([])
         else:
             error_response = {"status_code": response.status_code, "error": response.text}
             add_log("Fetch Knowledge Sources", "ERROR", endpoint, None, error_response, f"Status: {response.status_code}")
             st.error(f"❌ Failed to fetch knowledge sources (Status {response.status_code}): {response.text}")
-            return []
+            raise UncachedResult([])
             
     except requests.exceptions.RequestException as e:
         error_msg = f"❌ Network error: {str(e)}"
         st.error(error_msg)
         add_log("Fetch Knowledge Sources", "ERROR", endpoint, None, {"error": error_msg})
-        return []
+        raise UncachedResult([])
 
 def generate_simple_id(length=15):
     """Generate a random alphanumeric ID of specified length."""
-    characters = string.ascii_letters + string.digits
-    return ''.join(random.choice(characters) for _ in range(length))
+    return ''.join(ID_RANDOM.choices(ID_ALPHABET, k=length))
 
 def create_knowledge_source_with_random_id(name):
     """Create a new knowledge source with user-provided name and simple random ID."""
@@ -380,11 +681,12 @@ def create_knowledge_source_with_random_id(name):
     add_log("Create Knowledge Source", "INFO", endpoint, payload, details=f"Creating source: {name}")
     
     try:
-        response = requests.post(endpoint, headers=headers, json=payload, timeout=30)
+        response = get_http_session().post(endpoint, headers=headers, data=encode_json(payload), timeout=REQUEST_TIMEOUT)
         
         if response.status_code in [200, 201]:
-            response_data = response.json()
+            response_data = parse_json(response)
             add_log("Create Knowledge Source", "SUCCESS", endpoint, payload, response_data, f"Created: {name} (ID: {knowledge_source_id})")
+            get_existing_knowledge_sources.clear()
             
             if 'data' in response_data and 'id' in response_data['data']:
                 return response_data['data']['id']
@@ -413,12 +715,21 @@ def create_knowledge_source_with_random_id(name):
         return None
 
 # Article Fetching Functions
+def run_fetch_tasks(tasks):
+    """Run article fetch tasks concurrently, yielding each task's articles in task order."""
+    with create_executor(FETCH_WORKERS) as executor:
+        futures = [executor.submit(func, *args) for func, *args in tasks]
+        for future in futures:
+            yield future.result()
+
 def fetch_articles_with_filters(selected_locales=None, selected_brands=None, selected_categories=None):
     """Fetch articles with filters applied - only fetch what's specifically requested."""
     published_only = st.session_state.get('published_only', False)
     
-    all_articles = []
+    article_batches = []
     auth = get_zd_auth()
+    st.session_state['fetch_started_epoch'] = int(time.time())
+    st.session_state.pop('fetch_sync_scope', None)
     
     filter_parts = []
     if selected_locales:
@@ -433,62 +744,76 @@ def fetch_articles_with_filters(selected_locales=None, selected_brands=None, sel
     
     if not selected_locales and not selected_brands and not selected_categories:
         add_log("Fetch Articles", "INFO", "", {}, {}, "No filters specified - not fetching any articles")
-        st.info("🔍 No filters selected. Please enable and select at least one filter (Locale, Brand, or Category) to fetch articles.")
+        show_message("fetch", "info", "🔍 No filters selected. Please enable and select at least one filter (Locale, Brand, or Category) to fetch articles.")
         return []
     
     selected_brand_objects = []
     if selected_brands and 'brands' in st.session_state:
-        selected_brand_objects = [brand for brand in st.session_state['brands'] if brand['id'] in selected_brands]
+        selected_brand_ids = set(selected_brands)
+        selected_brand_objects = [brand for brand in st.session_state['brands'] if brand['id'] in selected_brand_ids]
     
+    tasks = []
+    fetched_by_category = False
     if selected_brands and not selected_locales:
         if not auth:
-            st.error("❌ Zendesk authentication is required to fetch articles by brand")
+            show_message("fetch", "error", "❌ Zendesk authentication is required to fetch articles by brand")
             return []
-        for brand in selected_brand_objects:
-            articles = fetch_brand_articles(brand, auth)
-            all_articles.extend(articles)
+        tasks = [(fetch_brand_articles, brand, auth) for brand in selected_brand_objects]
             
     elif selected_locales and not selected_brands:
         zd_subdomain = st.session_state.get('zd_subdomain', '')
-        for locale in selected_locales:
-            articles = fetch_locale_articles(locale, auth, zd_subdomain)
-            all_articles.extend(articles)
+        tasks = [(fetch_locale_articles, locale, auth, zd_subdomain) for locale in selected_locales]
             
     elif selected_brands and selected_locales:
         if not auth:
-            st.error("❌ Zendesk authentication is required to fetch articles by brand")
+            show_message("fetch", "error", "❌ Zendesk authentication is required to fetch articles by brand")
             return []
-        for brand in selected_brand_objects:
-            for locale in selected_locales:
-                articles = fetch_brand_locale_articles(brand, locale, auth)
-                all_articles.extend(articles)
+        tasks = [(fetch_brand_locale_articles, brand, locale, auth) for brand in selected_brand_objects for locale in selected_locales]
                 
     elif selected_categories and not selected_brands and not selected_locales:
         if not auth:
-            st.error("❌ Zendesk authentication is required to fetch articles by category")
+            show_message("fetch", "error", "❌ Zendesk authentication is required to fetch articles by category")
             return []
         zd_subdomain = st.session_state.get('zd_subdomain', '')
-        articles = fetch_all_articles_for_category_filter(auth, zd_subdomain)
-        all_articles = filter_by_categories(articles, selected_categories)
-    
-    if selected_categories and (selected_brands or selected_locales):
-        all_articles = filter_by_categories(all_articles, selected_categories)
+        sync_scope = get_sync_scope(zd_subdomain, selected_categories)
+        last_sync_epoch = st.session_state.get('sync_watermarks', {}).get(sync_scope)
+        if st.session_state.get('incremental_sync', False) and last_sync_epoch:
+            article_batches = [fetch_incremental_articles(auth, zd_subdomain, last_sync_epoch)]
+        else:
+            tasks = [(fetch_category_articles, category_id, auth, zd_subdomain) for category_id in selected_categories]
+            fetched_by_category = True
+        # Only a category-only fetch covers everything in its scope, so only it may move that scope's watermark
+        st.session_state['fetch_sync_scope'] = sync_scope
+    
+    if tasks:
+        add_log("Fetch Articles", "INFO", details=f"Running {len(tasks)} fetch tasks with up to {FETCH_WORKERS} workers")
+        article_batches = run_fetch_tasks(tasks)
+    
+    # Deduplicate by ID as results arrive. Translations share an ID but not their draft
+    # status, so the published filter has to run before the first copy wins.
+    articles_by_id = {}
+    fetched_count = 0
+    published_count = 0
+    for articles in article_batches:
+        fetched_count += len(articles)
+        for article in filter_published_articles(articles):
+            published_count += 1
+            articles_by_id.setdefault(article.get('id'), article)
     
-    # Filter for published articles only if requested
     if published_only:
-        before_count = len(all_articles)
-        all_articles = filter_published_articles(all_articles)
-        after_count = len(all_articles)
-        add_log("Filter Published", "INFO", details=f"Filtered {before_count} articles to {after_count} published articles")
-        st.info(f"📑 Filtered from {before_count} total articles to {after_count} published articles")
-    
-    seen_ids = set()
-    unique_articles = []
-    for article in all_articles:
-        article_id = article.get('id')
-        if article_id not in seen_ids:
-            seen_ids.add(article_id)
-            unique_articles.append(article)
+        add_log("Filter Published", "INFO", details=f"Filtered {fetched_count} articles to {published_count} published articles")
+        show_message("fetch", "info", f"📑 Filtered from {fetched_count} total articles to {published_count} published articles")
+    
+    unique_articles = list(articles_by_id.values())
+    
+    # Category endpoints already return only the selected categories
+    if selected_categories and not fetched_by_category:
+        unique_articles = filter_by_categories(unique_articles, selected_categories)
+    
+    # Resolve display fields once so the preview and formatter don't recompute them on every rerun
+    for article in unique_articles:
+        article['_corrected_url'] = correct_article_url(article)
+        article['_display_brand'] = article.get('_brand_name') or article.get('brand_id') or 'N/A'
     
     add_log("Fetch Articles", "SUCCESS", "Multiple endpoints", 
            {"filters": filter_desc}, 
@@ -497,110 +822,110 @@ def fetch_articles_with_filters(selected_locales=None, selected_brands=None, sel
     
     return unique_articles
 
-def fetch_brand_articles(brand, auth):
-    """Fetch articles for a specific brand using its own subdomain."""
+def fetch_article_page(url, auth, params, page, action, description):
+    """Fetch one page of a Help Center article listing. Returns the response data, or None on failure."""
+    try:
+        ZENDESK_LIMITER.wait()
+        response = get_http_session().get(url, auth=auth, params=params, timeout=REQUEST_TIMEOUT)
+        ZENDESK_LIMITER.observe(response.headers)
+        
+        if response.status_code == 200:
+            data = parse_json(response)
+            add_log(action, "SUCCESS", response.url, params,
+                   {"articles_on_page": len(data.get('articles', [])), "has_more": data.get('meta', {}).get('has_more')},
+                   f"{description}, Page: {page}")
+            return data
+        
+        error_response = {"status_code": response.status_code, "error": response.text}
+        add_log(action, "ERROR", response.url, params, error_response, f"Failed for {description}, Page: {page}")
+        show_message("fetch", "error", f"❌ Failed to fetch articles for {description} (Status {response.status_code}): {response.text}")
+            
+    except requests.exceptions.RequestException as e:
+        error_msg = f"❌ Network error for {description}: {str(e)}"
+        show_message("fetch", "error", error_msg)
+        add_log(action, "ERROR", url, params, {"error": error_msg})
+    
+    return None
+
+def fetch_paginated_articles(base_url, auth, action, description):
+    """Fetch every page of an article listing by following its cursor pagination links."""
+    articles = []
+    url = base_url
+    params = {'page[size]': 100, 'include': 'sections'}
+    page = 1
+    
+    while url:
+        data = fetch_article_page(url, auth, params, page, action, description)
+        if data is None:
+            break
+        page_articles = [slim_article(article) for article in data.get('articles', [])]
+        
+        # Side-loaded sections tell us each article's category without the globally loaded sections
+        if 'sections' in data:
+            section_categories = {section['id']: section.get('category_id') for section in data['sections']}
+            for article in page_articles:
+                article['_category_id'] = section_categories.get(article.get('section_id'))
+        
+        articles.extend(page_articles)
+        
+        # The next link already carries the page[after] cursor and page size
+        has_more = data.get('meta', {}).get('has_more', True)
+        url = data.get('links', {}).get('next') if has_more else None
+        params = None if url and 'include=' in url else {'include': 'sections'}
+        page += 1
+    
+    return articles
+
+def fetch_incremental_articles(auth, zd_subdomain, start_time):
+    """Fetch only the articles that changed since start_time using the incremental export endpoint."""
     articles = []
+    url = f"https://{zd_subdomain}.zendesk.com/api/v2/help_center/incremental/articles"
+    params = {'start_time': start_time}
     page = 1
     
+    add_log("Fetch Incremental Articles", "INFO", url, params,
+           details=f"Fetching articles updated since {datetime.datetime.fromtimestamp(start_time)}")
+    
+    while url:
+        data = fetch_article_page(url, auth, params, page, "Fetch Incremental Articles", "incremental sync")
+        if data is None or not data.get('articles'):
+            break
+        articles.extend(slim_article(article) for article in data['articles'])
+        url = data.get('next_page')
+        params = None
+        page += 1
+    
+    return articles
+
+def fetch_brand_articles(brand, auth):
+    """Fetch articles for a specific brand using its own subdomain."""
     brand_base_url = get_brand_base_url(brand)
     base_url = f"{brand_base_url}/api/v2/help_center/articles"
     
     add_log("Fetch Brand Articles", "INFO", base_url, {"brand": brand['name']}, 
            details=f"Fetching from brand: {brand['name']} via {brand_base_url}")
     
-    while True:
-        params = {'page': page, 'per_page': 100}
-        endpoint = f"{base_url}?{urllib.parse.urlencode(params)}"
-        
-        try:
-            response = requests.get(base_url, auth=auth, params=params, timeout=30)
-            time.sleep(RATE_LIMIT_DELAY)
-            
-            if response.status_code == 200:
-                data = response.json()
-                page_articles = data.get('articles', [])
-                
-                for article in page_articles:
-                    article['_brand_name'] = brand['name']
-                    article['_brand_id'] = brand['id']
-                    article['_brand_subdomain'] = brand.get('subdomain', '')
-                    article['_brand_url'] = brand_base_url
-                
-                articles.extend(page_articles)
-                
-                add_log("Fetch Brand Articles", "SUCCESS", endpoint, params, 
-                       {"articles_on_page": len(page_articles), "total_so_far": len(articles)},
-                       f"Brand: {brand['name']}, Page: {page}")
-                
-                if data.get('next_page'):
-                    page += 1
-                else:
-                    break
-            else:
-                error_response = {"status_code": response.status_code, "error": response.text}
-                add_log("Fetch Brand Articles", "ERROR", endpoint, params, error_response,
-                       f"Failed for brand: {brand['name']}")
-                st.error(f"❌ Failed to fetch articles for brand '{brand['name']}' (Status {response.status_code}): {response.text}")
-                break
-                
-        except requests.exceptions.RequestException as e:
-            error_msg = f"❌ Network error for brand {brand['name']}: {str(e)}"
-            st.error(error_msg)
-            add_log("Fetch Brand Articles", "ERROR", endpoint, params, {"error": error_msg})
-            break
+    articles = fetch_paginated_articles(base_url, auth, "Fetch Brand Articles", f"brand '{brand['name']}'")
+    
+    for article in articles:
+        article['_brand_name'] = brand['name']
+        article['_brand_id'] = brand['id']
+        article['_brand_subdomain'] = brand.get('subdomain', '')
+        article['_brand_url'] = brand_base_url
     
     return articles
 
 def fetch_locale_articles(locale, auth, zd_subdomain):
     """Fetch articles for a specific locale from main subdomain."""
-    articles = []
-    page = 1
     base_url = f"https://{zd_subdomain}.zendesk.com/api/v2/help_center/{locale}/articles"
     
     add_log("Fetch Locale Articles", "INFO", base_url, {"locale": locale},
            details=f"Fetching locale: {locale}")
     
-    while True:
-        params = {'page': page, 'per_page': 100}
-        endpoint = f"{base_url}?{urllib.parse.urlencode(params)}"
-        
-        try:
-            response = requests.get(base_url, auth=auth, params=params, timeout=30)
-            time.sleep(RATE_LIMIT_DELAY)
-            
-            if response.status_code == 200:
-                data = response.json()
-                page_articles = data.get('articles', [])
-                articles.extend(page_articles)
-                
-                add_log("Fetch Locale Articles", "SUCCESS", endpoint, params,
-                       {"articles_on_page": len(page_articles), "total_so_far": len(articles)},
-                       f"Locale: {locale}, Page: {page}")
-                
-                if data.get('next_page'):
-                    page += 1
-                else:
-                    break
-            else:
-                error_response = {"status_code": response.status_code, "error": response.text}
-                add_log("Fetch Locale Articles", "ERROR", endpoint, params, error_response,
-                       f"Failed for locale: {locale}")
-                st.error(f"❌ Failed to fetch articles for locale '{locale}' (Status {response.status_code}): {response.text}")
-                break
-                
-        except requests.exceptions.RequestException as e:
-            error_msg = f"❌ Network error for locale {locale}: {str(e)}"
-            st.error(error_msg)
-            add_log("Fetch Locale Articles", "ERROR", endpoint, params, {"error": error_msg})
-            break
-    
-    return articles
+    return fetch_paginated_articles(base_url, auth, "Fetch Locale Articles", f"locale '{locale}'")
 
 def fetch_brand_locale_articles(brand, locale, auth):
     """Fetch articles for a specific brand and locale combination."""
-    articles = []
-    page = 1
-    
     brand_base_url = get_brand_base_url(brand)
     base_url = f"{brand_base_url}/api/v2/help_center/{locale}/articles"
     
@@ -608,181 +933,185 @@ def fetch_brand_locale_articles(brand, locale, auth):
            {"brand": brand['name'], "locale": locale},
            details=f"Fetching brand: {brand['name']}, locale: {locale}")
     
-    while True:
-        params = {'page': page, 'per_page': 100}
-        endpoint = f"{base_url}?{urllib.parse.urlencode(params)}"
-        
-        try:
-            response = requests.get(base_url, auth=auth, params=params, timeout=30)
-            time.sleep(RATE_LIMIT_DELAY)
-            
-            if response.status_code == 200:
-                data = response.json()
-                page_articles = data.get('articles', [])
-                
-                for article in page_articles:
-                    article['_brand_name'] = brand['name']
-                    article['_brand_id'] = brand['id']
-                    article['_brand_subdomain'] = brand.get('subdomain', '')
-                    article['_brand_url'] = brand_base_url
-                
-                articles.extend(page_articles)
-                
-                add_log("Fetch Brand+Locale Articles", "SUCCESS", endpoint, params,
-                       {"articles_on_page": len(page_articles), "total_so_far": len(articles)},
-                       f"Brand: {brand['name']}, Locale: {locale}, Page: {page}")
-                
-                if data.get('next_page'):
-                    page += 1
-                else:
-                    break
-            else:
-                error_response = {"status_code": response.status_code, "error": response.text}
-                add_log("Fetch Brand+Locale Articles", "ERROR", endpoint, params, error_response,
-                       f"Failed for brand: {brand['name']}, locale: {locale}")
-                st.error(f"❌ Failed to fetch articles for brand '{brand['name']}', locale '{locale}' (Status {response.status_code}): {response.text}")
-                break
-                
-        except requests.exceptions.RequestException as e:
-            error_msg = f"❌ Network error for brand {brand['name']}, locale {locale}: {str(e)}"
-            st.error(error_msg)
-            add_log("Fetch Brand+Locale Articles", "ERROR", endpoint, params, {"error": error_msg})
-            break
+    articles = fetch_paginated_articles(base_url, auth, "Fetch Brand+Locale Articles", f"brand '{brand['name']}', locale '{locale}'")
+    
+    for article in articles:
+        article['_brand_name'] = brand['name']
+        article['_brand_id'] = brand['id']
+        article['_brand_subdomain'] = brand.get('subdomain', '')
+        article['_brand_url'] = brand_base_url
     
     return articles
 
-def fetch_all_articles_for_category_filter(auth, zd_subdomain):
-    """Fetch all articles when we need to filter by category."""
-    articles = []
-    page = 1
-    base_url = f"https://{zd_subdomain}.zendesk.com/api/v2/help_center/articles"
+def fetch_category_articles(category_id, auth, zd_subdomain):
+    """Fetch articles for a specific Help Center category."""
+    base_url = f"https://{zd_subdomain}.zendesk.com/api/v2/help_center/categories/{category_id}/articles"
     
-    while True:
-        params = {'page': page, 'per_page': 100}
-        try:
-            response = requests.get(base_url, auth=auth, params=params, timeout=30)
-            time.sleep(RATE_LIMIT_DELAY)
-            
-            if response.status_code == 200:
-                data = response.json()
-                articles.extend(data.get('articles', []))
-                if data.get('next_page'):
-                    page += 1
-                else:
-                    break
-            else:
-                st.error(f"❌ Failed to fetch articles for category filtering (Status {response.status_code}): {response.text}")
-                break
-                
-        except requests.exceptions.RequestException as e:
-            st.error(f"❌ Network error while fetching articles for category filtering: {str(e)}")
-            break
-    return articles
+    add_log("Fetch Category Articles", "INFO", base_url, {"category_id": category_id},
+           details=f"Fetching category: {category_id}")
+    
+    return fetch_paginated_articles(base_url, auth, "Fetch Category Articles", f"category {category_id}")
 
 def filter_by_categories(articles, selected_categories):
     """Filter articles by category."""
     if not selected_categories:
         return articles
-        
-    if 'sections' not in st.session_state or not st.session_state['sections']:
-        st.warning("⚠️ Cannot filter by categories: sections data not available")
+    
+    # Articles fetched with side-loaded sections already know their category
+    needs_sections = any('_category_id' not in article for article in articles)
+    if needs_sections and not st.session_state.get('sections'):
+        show_message("fetch", "warning", "⚠️ Cannot filter by categories: sections data not available")
         return articles
-        
-    filtered_articles = []
-    for article in articles:
-        article_section_id = article.get('section_id')
-        if article_section_id:
-            for section in st.session_state['sections']:
-                if section['id'] == article_section_id:
-                    if section.get('category_id') in selected_categories:
-                        filtered_articles.append(article)
-                        break
-    return filtered_articles
+    
+    section_categories = get_section_categories(st.session_state['sections']) if needs_sections else {}
+    selected_category_ids = set(selected_categories)
+    return [
+        article for article in articles
+        if article.get('_category_id', section_categories.get(article.get('section_id'))) in selected_category_ids
+    ]
+
+def get_section_categories(sections):
+    """Get a section ID to category ID mapping."""
+    return get_cached_value('section_categories', (sections,), (), lambda: {section['id']: section.get('category_id') for section in sections})
+
+def get_article_stats(articles):
+    """Get language, brand, section and publish counts using column reductions."""
+    def build():
+        # Only the counted fields become columns, so article bodies are never copied
+        stats_df = pd.DataFrame(articles, columns=['locale', 'section_id', 'draft', '_display_brand'])
+        published = int((~stats_df['draft'].astype('boolean').fillna(True)).sum())
+        return {
+            "languages": stats_df['locale'].nunique(dropna=False),
+            "brands": stats_df['_display_brand'].nunique(dropna=False),
+            "sections": stats_df['section_id'].nunique(dropna=False),
+            "published": published,
+            "drafts": len(articles) - published
+        }
+    
+    return get_cached_value('article_stats', (articles,), (), build)
+
+def get_title_index(articles):
+    """Get an array of lowercase article titles for searching."""
+    return get_cached_value('title_index', (articles,), (), lambda: np.array([article.get('title', '').lower() for article in articles], dtype=str))
+
+def get_brand_frame(brands):
+    """Get the brand to subdomain mapping table."""
+    def build():
+        # Fill each column directly instead of building a dict per brand
+        brand_columns = {
+            "Brand Name": [],
+            "Brand ID": [],
+            "Zendesk Subdomain": [],
+            "Custom Domain": [],
+            "Help Center URL": [],
+            "API Base URL": [],
+            "Uses Custom Domain": []
+        }
+        for brand in brands:
+            brand_base_url = get_brand_base_url(brand)
+            brand_columns["Brand Name"].append(brand['name'])
+            brand_columns["Brand ID"].append(brand['id'])
+            brand_columns["Zendesk Subdomain"].append(brand.get('subdomain', 'N/A'))
+            brand_columns["Custom Domain"].append(brand.get('host_mapping', 'None'))
+            brand_columns["Help Center URL"].append(f"{brand_base_url}/hc")
+            brand_columns["API Base URL"].append(f"{brand_base_url}/api/v2/help_center")
+            brand_columns["Uses Custom Domain"].append("✅ Yes" if brand.get('host_mapping') else "❌ No")
+        return pd.DataFrame(brand_columns)
+    
+    return get_cached_value('brand_frame', (brands,), (), build)
 
 def format_articles_for_ada(articles, knowledge_source_id, override_language=None):
     """Format articles for Ada with proper field mapping and corrected URLs."""
     add_log("Format Articles", "INFO", details=f"Formatting {len(articles)} articles with language override: {override_language}")
     
-    formatted_articles = []
-    converter = html2text.HTML2Text()
-    converter.ignore_links = False
-    skipped_count = 0
-
     # Get prefix settings
     use_prefix = st.session_state.get('use_article_prefix', False)
     article_prefix = st.session_state.get('article_prefix', '')
+    title_prefix = article_prefix.strip() if use_prefix else ''
 
-    for article in articles:
-        zd_id = article.get("id")
-        zd_title = article.get("title", "")
-        zd_body = article.get("body", "")
-        zd_html_url = article.get("html_url", "")
-        zd_locale = article.get("locale", "en")
-        
-        # Apply prefix to title if enabled
-        if use_prefix and article_prefix.strip():
-            final_title = f"{article_prefix.strip()}{zd_title}"
-        else:
-            final_title = zd_title
-        
-        # Determine language to use in Ada payload
-        if override_language and override_language.strip():
-            # Use user-specified language
-            ada_language = override_language.strip().lower()
-        else:
-            # Use language from Zendesk article
-            ada_language = zd_locale.lower() if zd_locale else "en"
-        
-        # Fix the URL to use the correct brand domain
-        corrected_url = zd_html_url
-        if article.get('_brand_url') and zd_html_url:
-            parsed_url = urllib.parse.urlparse(zd_html_url)
-            path = parsed_url.path
-            query = parsed_url.query
-            fragment = parsed_url.fragment
-            
-            brand_base_url = article.get('_brand_url')
-            corrected_url = f"{brand_base_url}{path}"
-            if query:
-                corrected_url += f"?{query}"
-            if fragment:
-                corrected_url += f"#{fragment}"
-            
-            add_log("URL Correction", "INFO", details=f"Original: {zd_html_url} -> Corrected: {corrected_url}")
-        
-        if zd_body is None:
-            zd_body = ""
-        markdown_content = converter.handle(zd_body)
-        
-        if not check_article_size(markdown_content):
-            skipped_count += 1
-            add_log("Format Articles", "WARNING", details=f"Article '{final_title[:30]}...' exceeds 100KB, skipped")
-            continue
-
-        ada_article = {
-            "id": f"zd_{zd_id}-{zd_locale}",  # Include locale in ID
-            "name": final_title[:255],  # Apply prefix and truncate
-            "content": markdown_content,
-            "knowledge_source_id": knowledge_source_id,
-            "url": corrected_url,
-            "tag_ids": [],
-            "language": ada_language
-        }
-        
-        formatted_articles.append(ada_article)
+    formatted_articles, skipped_titles, corrected_url_count = format_articles(articles, knowledge_source_id, override_language, title_prefix)
+    for title in skipped_titles:
+        add_log("Format Articles", "WARNING", details=f"Article '{title[:30]}...' exceeds 100KB, skipped")
+    skipped_count = len(skipped_titles)
+    
+    if corrected_url_count:
+        add_log("URL Correction", "INFO", details=f"Rewrote {corrected_url_count} article URLs onto their brand domains")
     
     language_desc = f"override: {override_language}" if override_language and override_language.strip() else "from Zendesk"
     prefix_desc = f"with prefix: '{article_prefix}'" if use_prefix and article_prefix.strip() else "no prefix"
     add_log("Format Articles", "SUCCESS", details=f"Formatted {len(formatted_articles)} articles, skipped {skipped_count}, language: {language_desc}, {prefix_desc}")
     return {"articles": formatted_articles}
 
-def upload_articles_to_ada(formatted_articles):
-    """Upload articles to Ada one by one using the bulk endpoint."""
+def get_formatted_payload(articles, knowledge_source_id, override_language=None, cached_only=False):
+    """Get the Ada payload for an article list. With cached_only, returns None instead of formatting."""
+    settings = (
+        knowledge_source_id,
+        override_language or None,
+        st.session_state.get('use_article_prefix', False),
+        st.session_state.get('article_prefix', '')
+    )
+    build = None if cached_only else lambda: format_articles_for_ada(articles, knowledge_source_id, override_language)
+    return get_cached_value('formatted_payload', (articles,), settings, build)
+
+def upload_article_batch(session, endpoint, headers, batch, label, limiter):
+    """Upload a batch of articles to Ada, retrying while rate limited. Returns (uploaded_count, retry_articles, error_count)."""
+    # The log only needs to identify each article, so it gets a short preview instead of a copy of the content
+    log_payload = [
+        {"id": article["id"], "name": article["name"], "content_preview": article["content"][:100] + ("..." if len(article["content"]) > 100 else "")}
+        for article in batch
+    ]
+    body = encode_json(batch)
+    add_log("Upload Batch", "INFO", endpoint, log_payload, details=f"Uploading {label} ({len(batch)} articles)")
+    
+    while True:
+        try:
+            limiter.wait()
+            response = session.post(endpoint, headers=headers, data=body, timeout=UPLOAD_TIMEOUT)
+            limiter.observe(response.headers)
+            
+            if response.status_code in [200, 201]:
+                response_data = parse_json(response)
+                failed_ids = get_failed_article_ids(response_data, [article['id'] for article in batch])
+                if failed_ids is None:
+                    # Without a result for every article there's no telling what landed, so none of them count as uploaded
+                    add_log("Upload Batch", "WARNING", endpoint, log_payload, response_data, f"{label}: unrecognized Ada response, treating {len(batch)} articles as failed")
+                    show_message("upload", "warning", f"⚠️ Couldn't confirm which articles in {label} were uploaded. Check the API logs.")
+                    return 0, [], len(batch)
+                failed_articles = [article for article in batch if article['id'] in failed_ids]
+                uploaded_count = len(batch) - len(failed_articles)
+                status = "WARNING" if failed_articles else "SUCCESS"
+                add_log("Upload Batch", status, endpoint, log_payload, response_data, f"{label}: {uploaded_count}/{len(batch)} articles uploaded")
+                show_message("upload", "success", f"✅ Uploaded {label}: {uploaded_count}/{len(batch)} articles")
+                return uploaded_count, failed_articles, 0
+            elif response.status_code == 429:
+                retry_after = get_retry_after(response)
+                error_response = {"status_code": response.status_code, "error": "Rate limited", "retry_after": retry_after}
+                add_log("Upload Batch", "WARNING", endpoint, log_payload, error_response, f"Rate limited on {label}")
+                show_message("upload", "warning", f"⏳ Rate limited while uploading {label}. Retrying in {retry_after}s...")
+                # Hold every upload worker, not just this one, until the server is ready again
+                limiter.pause(retry_after)
+            else:
+                error_response = {"status_code": response.status_code, "error": response.text}
+                add_log("Upload Batch", "ERROR", endpoint, log_payload, error_response, f"Failed: {label}")
+                show_message("upload", "error", f"❌ Failed to upload {label}. Status: {response.status_code}")
+                # Only a rejected payload can succeed when split up; auth, server and other client errors would fail per article too
+                if response.status_code in SPLITTABLE_UPLOAD_STATUSES and len(batch) > 1:
+                    return 0, batch, 0
+                return 0, [], len(batch)
+                
+        except requests.exceptions.RequestException as e:
+            error_msg = f"❌ Network error uploading {label}: {str(e)}"
+            show_message("upload", "error", error_msg)
+            add_log("Upload Batch", "ERROR", endpoint, log_payload, {"error": error_msg})
+            return 0, [], len(batch)
+
+def upload_articles_to_ada(formatted_articles, sync_scope=None, fetched_epoch=None):
+    """Upload articles to Ada in concurrent batches using the bulk endpoint."""
     ada_subdomain = st.session_state.get('ada_subdomain', '')
     ada_api_token = st.session_state.get('ada_api_token', '')
     
     if not ada_subdomain or not ada_api_token:
-        st.error("❌ Ada subdomain and API token are required for upload")
+        show_message("upload", "error", "❌ Ada subdomain and API token are required for upload")
         return
     
     headers = {
@@ -791,50 +1120,45 @@ def upload_articles_to_ada(formatted_articles):
     }
     
     articles = formatted_articles["articles"]
+    batches = pack_upload_batches(articles, st.session_state.get('upload_batch_size', UPLOAD_BATCH_SIZE))
     endpoint = f"https://{ada_subdomain}.ada.support/api/v2/knowledge/bulk/articles/"
-    add_log("Upload Articles", "INFO", endpoint, details=f"Starting upload of {len(articles)} articles")
+    add_log("Upload Articles", "INFO", endpoint, details=f"Starting upload of {len(articles)} articles in {len(batches)} batches with {UPLOAD_WORKERS} workers")
     
     success_count = 0
     error_count = 0
-    
-    for i, article in enumerate(articles, 1):
-        payload = [article]
+    failed_articles = []
+    session = get_http_session()
+    limiter = RateLimiter(RATE_LIMIT_DELAY)
+    
+    with create_executor(UPLOAD_WORKERS) as executor:
+        futures = [
+            executor.submit(upload_article_batch, session, endpoint, headers, batch, f"batch {i}/{len(batches)}", limiter)
+            for i, batch in enumerate(batches, 1)
+        ]
+        for future in as_completed(futures):
+            uploaded_count, retry_articles, batch_errors = future.result()
+            success_count += uploaded_count
+            failed_articles.extend(retry_articles)
+            error_count += batch_errors
         
-        while True:
-            log_payload = [{**article, "content": article["content"][:100] + "..." if len(article["content"]) > 100 else article["content"]}]
-            add_log("Upload Article", "INFO", endpoint, log_payload, details=f"Uploading article {i}/{len(articles)}: {article['name'][:40]}...")
-            
-            try:
-                response = requests.post(endpoint, headers=headers, json=payload, timeout=30)
-                time.sleep(RATE_LIMIT_DELAY)
-                
-                if response.status_code in [200, 201]:
-                    success_count += 1
-                    response_data = response.json()
-                    add_log("Upload Article", "SUCCESS", endpoint, log_payload, response_data, f"({i}/{len(articles)}) {article['name'][:40]}...")
-                    st.success(f"✅ Successfully uploaded article {i}/{len(articles)}: '{article['name']}'")
-                    break
-                elif response.status_code == 429:
-                    error_response = {"status_code": response.status_code, "error": "Rate limited"}
-                    add_log("Upload Article", "WARNING", endpoint, log_payload, error_response, f"Rate limited on article {i}")
-                    st.warning(f"⏳ Rate limited while uploading article {i}. Retrying after delay...")
-                    time.sleep(60)
-                else:
-                    error_count += 1
-                    error_response = {"status_code": response.status_code, "error": response.text}
-                    add_log("Upload Article", "ERROR", endpoint, log_payload, error_response, f"({i}/{len(articles)}) {article['name'][:30]}...")
-                    st.error(f"❌ Failed to upload article {i}: '{article['name']}'. Status: {response.status_code}")
-                    break
-                    
-            except requests.exceptions.RequestException as e:
-                error_count += 1
-                error_msg = f"❌ Network error uploading article {i}: {str(e)}"
-                st.error(error_msg)
-                add_log("Upload Article", "ERROR", endpoint, log_payload, {"error": error_msg})
-                break
+        # Retry articles Ada rejected individually, one per request so a bad article can't sink a whole batch
+        if failed_articles:
+            add_log("Upload Articles", "INFO", endpoint, details=f"Retrying {len(failed_articles)} failed articles individually")
+            futures = [
+                executor.submit(upload_article_batch, session, endpoint, headers, [article], f"retry {i}/{len(failed_articles)} '{article['name'][:40]}'", limiter)
+                for i, article in enumerate(failed_articles, 1)
+            ]
+            for future in as_completed(futures):
+                uploaded_count, retry_articles, batch_errors = future.result()
+                success_count += uploaded_count
+                error_count += len(retry_articles) + batch_errors
     
     summary = {"success_count": success_count, "error_count": error_count, "total_articles": len(articles)}
     add_log("Upload Articles", "SUCCESS", endpoint, None, summary, f"Upload completed: {success_count} success, {error_count} errors")
+    
+    # Remember when the uploaded articles were fetched so the next sync of the same categories can fetch only what changed since
+    if error_count == 0 and sync_scope is not None:
+        st.session_state.setdefault('sync_watermarks', {})[sync_scope] = fetched_epoch
 
 # UI CODE STARTS HERE
 st.title("Zendesk Article Management")
@@ -857,6 +1181,7 @@ st.text_input("Ada Knowledge API Token", type="password", key='ada_api_token')
 st.subheader("⚙️ Access Options")
 st.checkbox("Include articles behind login", key='include_restricted', help="Requires authentication to access private articles")
 st.checkbox("📑 Published articles only", key='published_only', help="Only fetch and upload published articles (not drafts)")
+st.checkbox("🔄 Only articles updated since last sync", key='incremental_sync', help="When filtering by category only, fetch just the articles changed since the last successful upload of the same categories in this session")
 
 # Article Name Prefix Options
 st.subheader("📝 Article Name Configuration")
@@ -937,9 +1262,9 @@ with st.expander("🔍 Debug Information"):
             if st.button("🧪 Test Zendesk Connection", key="test_zd_connection"):
                 try:
                     test_url = f"https://{zd_subdomain}.zendesk.com/api/v2/users/me.json"
-                    response = requests.get(test_url, auth=auth, timeout=10)
+                    response = get_http_session().get(test_url, auth=auth, timeout=10)
                     if response.status_code == 200:
-                        user_data = response.json()
+                        user_data = parse_json(response)
                         st.success(f"✅ Connection successful! Logged in as: {user_data.get('user', {}).get('name', 'Unknown')}")
                     else:
                         st.error(f"❌ Connection failed: Status {response.status_code}")
@@ -962,22 +1287,32 @@ with col1:
     if st.button('Load Filter Options', key="load_filters_btn", disabled=not can_load_filters):
         if can_load_filters:
             with st.spinner("Loading filter options..."):
-                locales = get_locales()
-                
-                # Only load brands and categories if credentials are available
-                if has_credentials:
-                    brands = get_brands()
-                    categories = get_categories()
-                    sections = get_sections()
-                else:
-                    brands = []
-                    categories = []
-                    sections = []
+                # The metadata endpoints are independent, so request them concurrently
+                with create_executor(4) as executor:
+                    locales_future = executor.submit(get_locales, zd_subdomain, zd_email, zd_token)
+                    
+                    # Only load brands and categories if credentials are available
+                    if has_credentials:
+                        brands_future = executor.submit(get_brands, zd_subdomain, zd_email, zd_token)
+                        categories_future = executor.submit(get_categories, zd_subdomain, zd_email, zd_token)
+                        sections_future = executor.submit(get_sections, zd_subdomain, zd_email, zd_token)
+                        brands = brands_future.result()
+                        categories = categories_future.result()
+                        sections = sections_future.result()
+                    else:
+                        brands = []
+                        categories = []
+                        sections = []
+                    
+                    locales = locales_future.result()
                 
                 st.session_state['locales'] = locales
                 st.session_state['brands'] = brands
                 st.session_state['categories'] = categories
                 st.session_state['sections'] = sections
+                # Filters select by ID so brands or categories that share a name stay separately selectable
+                st.session_state['brand_labels'] = build_option_labels(brands)
+                st.session_state['category_labels'] = build_option_labels(categories)
                 
                 # Show summary of what was loaded
                 loaded_items = []
@@ -997,6 +1332,14 @@ with col1:
     
     if not can_load_filters:
         st.info("💡 Provide Zendesk subdomain to load filter options")
+    
+    if st.button("🔄 Refresh Metadata", key="refresh_metadata_btn", help="Clear cached locales, brands, categories, sections and knowledge sources"):
+        get_locales.clear()
+        get_brands.clear()
+        get_categories.clear()
+        get_sections.clear()
+        get_existing_knowledge_sources.clear()
+        st.success("✅ Cached metadata cleared. Load filter options again to fetch fresh data.")
 
 with col2:
     selected_locales = None
@@ -1025,15 +1368,16 @@ with col2:
     if 'brands' in st.session_state and st.session_state['brands']:
         use_brand_filter = st.checkbox("Enable Brand Filter", key="use_brand_filter", disabled=not has_credentials)
         if use_brand_filter and has_credentials:
-            brand_options = [(brand['name'], brand['id']) for brand in st.session_state['brands']]
-            selected_brand_names = st.multiselect(
+            brand_labels = st.session_state.get('brand_labels', {})
+            selected_brand_ids = st.multiselect(
                 "Select Brands", 
-                options=[name for name, _ in brand_options],
+                options=list(brand_labels),
+                format_func=brand_labels.get,
                 help="Select specific brands to filter by",
                 key="brand_multiselect"
             )
-            if selected_brand_names:
-                selected_brands = [brand_id for name, brand_id in brand_options if name in selected_brand_names]
+            if selected_brand_ids:
+                selected_brands = selected_brand_ids
         elif use_brand_filter and not has_credentials:
             st.warning("⚠️ Brand filter requires Zendesk authentication")
         else:
@@ -1051,15 +1395,16 @@ with col2:
     if 'categories' in st.session_state and st.session_state['categories']:
         use_category_filter = st.checkbox("Enable Category Filter", key="use_category_filter", disabled=not has_credentials)
         if use_category_filter and has_credentials:
-            category_options = [(cat['name'], cat['id']) for cat in st.session_state['categories']]
-            selected_category_names = st.multiselect(
+            category_labels = st.session_state.get('category_labels', {})
+            selected_category_ids = st.multiselect(
                 "Select Categories", 
-                options=[name for name, _ in category_options],
+                options=list(category_labels),
+                format_func=category_labels.get,
                 help="Select specific categories to filter by",
                 key="category_multiselect"
             )
-            if selected_category_names:
-                selected_categories = [cat_id for name, cat_id in category_options if name in selected_category_names]
+            if selected_category_ids:
+                selected_categories = selected_category_ids
         elif use_category_filter and not has_credentials:
             st.warning("⚠️ Category filter requires Zendesk authentication")
         else:
@@ -1078,23 +1423,7 @@ if 'brands' in st.session_state and st.session_state['brands']:
     with st.expander("🏢 Brand → Subdomain Mapping", expanded=False):
         st.write("**Mapping between brands and their Help Center subdomains:**")
         
-        brand_mapping_data = []
-        for brand in st.session_state['brands']:
-            brand_base_url = get_brand_base_url(brand)
-            help_center_url = f"{brand_base_url}/hc"
-            api_base_url = f"{brand_base_url}/api/v2/help_center"
-            
-            brand_mapping_data.append({
-                "Brand Name": brand['name'],
-                "Brand ID": brand['id'],
-                "Zendesk Subdomain": brand.get('subdomain', 'N/A'),
-                "Custom Domain": brand.get('host_mapping', 'None'),
-                "Help Center URL": help_center_url,
-                "API Base URL": api_base_url,
-                "Uses Custom Domain": "✅ Yes" if brand.get('host_mapping') else "❌ No"
-            })
-        
-        brands_df = pd.DataFrame(brand_mapping_data)
+        brands_df = get_brand_frame(st.session_state['brands'])
         
         st.dataframe(
             brands_df,
@@ -1110,14 +1439,14 @@ if 'brands' in st.session_state and st.session_state['brands']:
         with col1:
             st.metric("Total Brands", len(st.session_state['brands']))
         with col2:
-            custom_domains = sum(1 for brand in st.session_state['brands'] if brand.get('host_mapping'))
+            custom_domains = int((brands_df["Uses Custom Domain"] == "✅ Yes").sum())
             st.metric("Custom Domains", custom_domains)
         with col3:
             zendesk_subdomains = len(st.session_state['brands']) - custom_domains
             st.metric("Zendesk Subdomains", zendesk_subdomains)
         
         if st.button("📥 Download Brand Mapping", key="download_brand_mapping_btn"):
-            brands_json = json.dumps(brand_mapping_data, indent=2)
+            brands_json = get_download_bytes('brand_mapping', st.session_state['brands'], lambda: brands_df.to_dict('records'))
             st.download_button(
                 label="Download Brand Mapping JSON",
                 data=brands_json,
@@ -1142,11 +1471,13 @@ if can_fetch:
         filter_summary.append(f"Locales: {', '.join(selected_locales)}")
         
     if selected_brands:
-        brand_names = [name for name, brand_id in [(brand['name'], brand['id']) for brand in st.session_state.get('brands', [])] if brand_id in selected_brands]
+        brand_labels = st.session_state.get('brand_labels', {})
+        brand_names = [brand_labels[brand_id] for brand_id in selected_brands]
         filter_summary.append(f"Brands: {', '.join(brand_names)}")
         
     if selected_categories:
-        cat_names = [name for name, cat_id in [(cat['name'], cat['id']) for cat in st.session_state.get('categories', [])] if cat_id in selected_categories]
+        category_labels = st.session_state.get('category_labels', {})
+        cat_names = [category_labels[cat_id] for cat_id in selected_categories]
         filter_summary.append(f"Categories: {', '.join(cat_names)}")
     
     if published_only:
@@ -1157,20 +1488,46 @@ if can_fetch:
     else:
         st.warning("⚠️ **No filters selected** - Please enable and select at least one filter to fetch articles")
 
+# Incremental sync only applies to category-only fetches, and each category selection keeps its own watermark
+if st.session_state.get('incremental_sync', False) and selected_categories and not selected_brands and not selected_locales:
+    last_sync_epoch = st.session_state.get('sync_watermarks', {}).get(get_sync_scope(zd_subdomain, selected_categories))
+    if last_sync_epoch:
+        st.info(f"🔄 Last sync of these categories: {datetime.datetime.fromtimestamp(last_sync_epoch).strftime('%Y-%m-%d %H:%M:%S')}")
+    else:
+        st.info("🔄 No sync recorded yet for these categories in this session - the first fetch will include all articles")
+
 # Fetch Articles Button
-if st.button('📥 Fetch Articles from Zendesk', disabled=not can_fetch, key="fetch_articles_btn"):
+# The crawl runs on a background thread so widget changes during a long fetch don't restart it
+# A running upload clears the fetched articles when it finishes, so fetching waits for it too
+fetch_running = 'fetch_future' in st.session_state or 'upload_future' in st.session_state
+if st.button('📥 Fetch Articles from Zendesk', disabled=not can_fetch or fetch_running, key="fetch_articles_btn"):
     if not is_valid_subdomain(zd_subdomain):
         st.error("❌ The provided Zendesk Subdomain is not valid.")
     else:
-        with st.spinner("Fetching articles from Zendesk..."):
-            articles = fetch_articles_with_filters(
-                selected_locales=selected_locales,
-                selected_brands=selected_brands,
-                selected_categories=selected_categories
-            )
-            
+        start_background_job(
+            'fetch',
+            fetch_articles_with_filters,
+            selected_locales=selected_locales,
+            selected_brands=selected_brands,
+            selected_categories=selected_categories
+        )
+
+if 'fetch_future' in st.session_state:
+    fetch_future = finish_background_job('fetch')
+    if fetch_future is None:
+        show_background_status('fetch', "Fetching articles from Zendesk...")
+    else:
+        try:
+            articles = fetch_future.result()
+        except Exception as e:
+            articles = None
+            add_log("Fetch Articles", "ERROR", details=f"Fetch failed: {str(e)}")
+            st.error(f"❌ Fetching articles failed: {str(e)}")
+        else:
             if articles:
                 st.session_state['fetched_articles'] = articles
+                # Keep the sync scope with the articles it describes so a later fetch can't redirect their watermark
+                st.session_state['fetched_sync'] = (st.session_state.get('fetch_sync_scope'), st.session_state.get('fetch_started_epoch'))
                 st.success(f"✅ Successfully fetched {len(articles)} articles from Zendesk!")
             else:
                 st.warning("⚠️ No articles found with the current filters.")
@@ -1182,34 +1539,34 @@ if 'fetched_articles' in st.session_state:
     
     col1, col2, col3, col4 = st.columns(4)
     articles = st.session_state['fetched_articles']
+    article_stats = get_article_stats(articles)
     
     with col1:
-        locales = set(article.get('locale', 'N/A') for article in articles)
-        st.metric("Languages", len(locales))
+        st.metric("Languages", article_stats['languages'])
     
     with col2:
-        brands = set(article.get('_brand_name', article.get('brand_id', 'N/A')) for article in articles)
-        st.metric("Brands", len(brands))
+        st.metric("Brands", article_stats['brands'])
     
     with col3:
-        sections = set(article.get('section_id', 'N/A') for article in articles)
-        st.metric("Sections", len(sections))
+        st.metric("Sections", article_stats['sections'])
     
     with col4:
-        published = sum(1 for article in articles if not article.get('draft', True))
-        drafts = sum(1 for article in articles if article.get('draft', True))
-        st.metric("Published", published)
-        st.caption(f"Drafts: {drafts}")
+        st.metric("Published", article_stats['published'])
+        st.caption(f"Drafts: {article_stats['drafts']}")
     
     with st.expander("📋 Article Details", expanded=False):
-        search_term = st.text_input("🔍 Search articles", placeholder="Search by title...", key="article_search")
+        # A form only reruns on submit, not on every keystroke
+        with st.form("article_search_form", border=False):
+            search_col, button_col = st.columns([4, 1], vertical_alignment="bottom")
+            with search_col:
+                search_term = st.text_input("🔍 Search articles", placeholder="Search by title...", key="article_search")
+            with button_col:
+                st.form_submit_button("Search", key="article_search_btn")
         
         filtered_articles = articles
         if search_term:
-            filtered_articles = [
-                article for article in articles 
-                if search_term.lower() in article.get('title', '').lower()
-            ]
+            matches = np.char.find(get_title_index(articles), search_term.lower()) >= 0
+            filtered_articles = [articles[i] for i in np.flatnonzero(matches)]
         
         st.write(f"Showing {len(filtered_articles)} of {len(articles)} articles")
         
@@ -1231,15 +1588,12 @@ if 'fetched_articles' in st.session_state:
                     else:
                         st.write(f"**{i+1}. {original_title}** {status_icon} {status_text}")
                     
-                    brand_display = article.get('_brand_name', article.get('brand_id', 'N/A'))
-                    brand_url = article.get('_brand_url', 'N/A')
-                    st.write(f"🌐 Locale: {article.get('locale', 'N/A')} | 🏢 Brand: {brand_display} | 📂 Section: {article.get('section_id', 'N/A')}")
+                    st.write(f"🌐 Locale: {article.get('locale', 'N/A')} | 🏢 Brand: {article.get('_display_brand', 'N/A')} | 📂 Section: {article.get('section_id', 'N/A')}")
                     
                     # Show corrected URL
                     original_url = article.get('html_url', '')
-                    if original_url and brand_url != 'N/A':
-                        parsed_url = urllib.parse.urlparse(original_url)
-                        corrected_url = f"{brand_url}{parsed_url.path}"
+                    corrected_url = article.get('_corrected_url', original_url)
+                    if original_url and corrected_url != original_url:
                         st.write(f"📄 Original URL: {original_url}")
                         st.write(f"✅ Corrected URL: {corrected_url}")
                         display_url = corrected_url
@@ -1258,7 +1612,7 @@ if 'fetched_articles' in st.session_state:
             st.info(f"... and {len(filtered_articles) - 20} more articles. Use search to find specific articles.")
     
     if st.button("📥 Download Articles as JSON", key="download_articles_btn"):
-        articles_json = json.dumps(st.session_state['fetched_articles'], indent=2)
+        articles_json = get_download_bytes('articles', st.session_state['fetched_articles'])
         st.download_button(
             label="Download Articles JSON",
             data=articles_json,
@@ -1286,7 +1640,7 @@ if 'fetched_articles' in st.session_state:
     if use_existing_source == "Use existing knowledge source":
         if st.button("Load Existing Knowledge Sources", key="load_knowledge_sources_btn"):
             if ada_subdomain and ada_api_token:
-                existing_sources = get_existing_knowledge_sources()
+                existing_sources = get_existing_knowledge_sources(ada_subdomain, ada_api_token)
                 if existing_sources:
                     st.session_state['available_sources'] = existing_sources
                     st.success("✅ Knowledge sources loaded successfully!")
@@ -1360,8 +1714,13 @@ if 'fetched_articles' in st.session_state:
         if st.session_state.get('use_language_override', False):
             override_lang = st.session_state.get('language_override_input', "").strip()
         
-        sample_articles = st.session_state['fetched_articles'][:3]
-        formatted_sample = format_articles_for_ada(sample_articles, selected_source_id, override_lang)
+        # Reuse the full payload if it was already built for a download; otherwise format just the sample
+        full_formatted = get_formatted_payload(st.session_state['fetched_articles'], selected_source_id, override_lang, cached_only=True)
+        if full_formatted is not None:
+            formatted_sample = {"articles": full_formatted['articles'][:3]}
+        else:
+            sample_articles = st.session_state['fetched_articles'][:3]
+            formatted_sample = format_articles_for_ada(sample_articles, selected_source_id, override_lang)
         
         with st.expander("Sample Ada API Payload (first 3 articles)"):
             payload_preview = []
@@ -1375,7 +1734,7 @@ if 'fetched_articles' in st.session_state:
         
         col1, col2, col3 = st.columns(3)
         with col1:
-            total_size = sum(len(json.dumps(article).encode('utf-8')) for article in formatted_sample['articles'])
+            total_size = len(encode_json(formatted_sample['articles']))
             st.metric("Total Payload Size", f"{total_size:,} bytes")
         with col2:
             if formatted_sample['articles']:
@@ -1393,8 +1752,8 @@ if 'fetched_articles' in st.session_state:
             st.info(f"📝 **Article names will have prefix:** '{prefix}' (e.g., '{prefix}Example Article Title')")
         
         if st.button("📥 Download Full Ada Payload as JSON", key="download_ada_payload_btn"):
-            full_formatted = format_articles_for_ada(st.session_state['fetched_articles'], selected_source_id, override_lang)
-            payload_json = json.dumps(full_formatted['articles'], indent=2)
+            full_formatted = get_formatted_payload(st.session_state['fetched_articles'], selected_source_id, override_lang)
+            payload_json = get_download_bytes('ada_payload', full_formatted['articles'])
             st.download_button(
                 label="Download Payload JSON",
                 data=payload_json,
@@ -1403,24 +1762,49 @@ if 'fetched_articles' in st.session_state:
                 key="download_ada_payload_file_btn"
             )
 
-        upload_ready = 'fetched_articles' in st.session_state and selected_source_id
+        st.number_input("Articles per upload request", min_value=1, max_value=MAX_UPLOAD_BATCH_SIZE, value=UPLOAD_BATCH_SIZE, key="upload_batch_size",
+                        help="How many articles to send in each bulk request. Lower this if large articles cause batches to fail.")
+        
+        # The upload runs on a background thread so the page stays usable while batches are sent
+        # A finished upload clears the fetched articles, so it also waits for any fetch still running
+        upload_running = 'upload_future' in st.session_state or 'fetch_future' in st.session_state
+        upload_ready = 'fetched_articles' in st.session_state and selected_source_id and not upload_running
         if st.button('🚀 Upload Articles to Ada', disabled=not upload_ready, key="upload_articles_btn"):
-            with st.spinner("Uploading articles to Ada..."):
+            with st.spinner("Preparing articles for upload..."):
                 # Get language override for upload
                 final_override_lang = None
                 if st.session_state.get('use_language_override', False):
                     final_override_lang = st.session_state.get('language_override_input', "").strip()
                 
-                formatted_articles = format_articles_for_ada(st.session_state['fetched_articles'], selected_source_id, final_override_lang)
-                upload_articles_to_ada(formatted_articles)
+                formatted_articles = get_formatted_payload(st.session_state['fetched_articles'], selected_source_id, final_override_lang)
                 total_uploaded = len(formatted_articles['articles'])
                 
                 language_msg = f" with language override: {final_override_lang}" if final_override_lang else " using Zendesk languages"
                 prefix_msg = f" with prefix: '{st.session_state.get('article_prefix', '')}'" if st.session_state.get('use_article_prefix', False) and st.session_state.get('article_prefix', '') else ""
-                st.success(f"🎉 Upload completed! Total articles uploaded: {total_uploaded}{language_msg}{prefix_msg}")
-                
-                if 'fetched_articles' in st.session_state:
-                    del st.session_state['fetched_articles']
+                st.session_state['upload_summary'] = f"🎉 Upload completed! Total articles uploaded: {total_uploaded}{language_msg}{prefix_msg}"
+                sync_scope, fetched_epoch = st.session_state.get('fetched_sync', (None, None))
+                start_background_job('upload', upload_articles_to_ada, formatted_articles, sync_scope, fetched_epoch)
+
+# Upload status lives outside the source selection so a running upload is always collected
+if 'upload_future' in st.session_state:
+    upload_future = finish_background_job('upload')
+    if upload_future is None:
+        show_background_status('upload', "Uploading articles to Ada...")
+    else:
+        upload_summary = st.session_state.pop('upload_summary', "")
+        try:
+            upload_future.result()
+        except Exception as e:
+            add_log("Upload Articles", "ERROR", details=f"Upload failed: {str(e)}")
+            st.error(f"❌ Uploading articles failed: {str(e)}")
+        else:
+            st.success(upload_summary)
+            
+            if 'fetched_articles' in st.session_state:
+                del st.session_state['fetched_articles']
+            st.session_state.pop('fetched_sync', None)
+            st.session_state.pop('formatted_payload', None)
+            st.session_state.pop('download_cache', None)
 
 # API Logs Section
 st.subheader("📜 API Logs")
@@ -1433,43 +1817,21 @@ with col1:
 
 with col2:
     show_payloads = st.checkbox("Show Payloads", value=False, key="show_payloads_checkbox")
+    st.checkbox("Record Payloads", value=True, key="debug_logs", help="Turn off to skip serializing request/response payloads into new log entries")
 
 with col3:
     log_filter = st.selectbox("Filter by Status", ["All", "SUCCESS", "ERROR", "WARNING", "INFO"], key="log_filter_selector")
 
 if st.session_state.get('api_logs'):
-    logs_df = pd.DataFrame(st.session_state['api_logs'])
-    
-    if log_filter != "All":
-        logs_df = logs_df[logs_df['status'] == log_filter]
-    
-    if show_payloads:
-        display_columns = ['timestamp', 'action', 'status', 'endpoint', 'request', 'response', 'details']
-    else:
-        display_columns = ['timestamp', 'action', 'status', 'endpoint', 'details']
-        logs_df = logs_df[display_columns]
-    
-    def style_status(val):
-        if val == "SUCCESS":
-            return "background-color: #d4edda; color: #155724"
-        elif val == "ERROR":
-            return "background-color: #f8d7da; color: #721c24"
-        elif val == "WARNING":
-            return "background-color: #fff3cd; color: #856404"
-        else:
-            return "background-color: #d1ecf1; color: #0c5460"
-    
-    logs_df = logs_df.iloc[::-1].reset_index(drop=True)
-    
     st.dataframe(
-        logs_df.style.applymap(style_status, subset=['status']),
+        get_logs_view(st.session_state['api_logs'], log_filter, show_payloads),
         use_container_width=True,
         height=400,
         hide_index=True
     )
     
     if st.button("📥 Download Logs as JSON", key="download_logs_btn"):
-        logs_json = json.dumps(st.session_state['api_logs'], indent=2)
+        logs_json = dump_json(get_log_snapshot())
         st.download_button(
             label="Download JSON",
             data=logs_json,